@@ -8,10 +8,10 @@ import os
 import threading
 import asyncio
 import time
-from dotenv import load_dotenv
+from src.utils.env_loader import load_env
 
 # Load environment variables
-load_dotenv("config/.env")
+load_env()
 
 def run_discord_bot_async():
     """Run the Discord bot asynchronously using existing bot setup"""
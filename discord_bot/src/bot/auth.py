@@ -1,16 +1,48 @@
 import os
+import asyncio
 import threading
-import time
 from flask import Flask, redirect, url_for, jsonify, session
 from flask_dance.contrib.github import make_github_blueprint, github
-from dotenv import load_dotenv
 from werkzeug.middleware.proxy_fix import ProxyFix
 
-load_dotenv()
+from ..utils.env_loader import load_env, get_env
 
-# Global state for OAuth sessions (keyed by Discord user ID)
-oauth_sessions = {}
-oauth_sessions_lock = threading.Lock()
+load_env()
+
+# Pending /link requests awaiting the OAuth callback (keyed by Discord user ID).
+# Each entry holds the bot's event loop and the future to resolve with the GitHub username.
+pending_auth = {}
+pending_auth_lock = threading.Lock()
+
+def register_pending_auth(discord_user_id):
+    """Create a future on the running event loop that the OAuth callback resolves."""
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    with pending_auth_lock:
+        pending_auth[discord_user_id] = (loop, future)
+    return future
+
+def cancel_pending_auth(discord_user_id):
+    """Drop a pending OAuth request once /link stops waiting for it."""
+    with pending_auth_lock:
+        pending_auth.pop(discord_user_id, None)
+
+def _set_future_result(future, github_username):
+    """Resolve the future unless it was already cancelled or timed out."""
+    if not future.done():
+        future.set_result(github_username)
+
+def _complete_pending_auth(discord_user_id, github_username):
+    """Hand the OAuth result to the waiting /link command from the Flask thread."""
+    with pending_auth_lock:
+        entry = pending_auth.pop(discord_user_id, None)
+    
+    if not entry:
+        print(f"No pending link request for Discord user: {discord_user_id}")
+        return
+    
+    loop, future = entry
+    loop.call_soon_threadsafe(_set_future_result, future, github_username)
 
 def create_oauth_app():
     """
@@ -18,22 +50,22 @@ def create_oauth_app():
     This returns a Flask app that can be run alongside the Discord bot.
     """
     app = Flask(__name__)
-    app.secret_key = os.getenv("SECRET_KEY", "super-secret-oauth-key")
+    app.secret_key = get_env("SECRET_KEY", "super-secret-oauth-key")
     app.wsgi_app = ProxyFix(app.wsgi_app, x_proto=1, x_host=1)
     
     # Set OAuth transport to allow HTTP in development, HTTPS in production
-    if os.getenv("DEVELOPMENT"):
+    if get_env("DEVELOPMENT"):
         os.environ['OAUTHLIB_INSECURE_TRANSPORT'] = '1'
     
     # Get the base URL for OAuth callbacks (Cloud Run URL)
-    base_url = os.getenv("OAUTH_BASE_URL")
+    base_url = get_env("OAUTH_BASE_URL")
     if not base_url:
         raise ValueError("OAUTH_BASE_URL environment variable is required")
     
     # OAuth blueprint with custom callback URL (avoiding Flask-Dance auto routes)
     github_blueprint = make_github_blueprint(
-        client_id=os.getenv("GITHUB_CLIENT_ID"),
-        client_secret=os.getenv("GITHUB_CLIENT_SECRET"),
+        client_id=get_env("GITHUB_CLIENT_ID"),
+        client_secret=get_env("GITHUB_CLIENT_SECRET"),
         redirect_url=f"{base_url}/auth/callback"
     )
     app.register_blueprint(github_blueprint, url_prefix="/login")
@@ -49,13 +81,6 @@ def create_oauth_app():
     def start_oauth(discord_user_id):
         """Start OAuth flow for a specific Discord user"""
         try:
-            with oauth_sessions_lock:
-                # Clear any existing session for this user
-                oauth_sessions[discord_user_id] = {
-                    'status': 'pending',
-                    'created_at': time.time()
-                }
-            
             # Store user ID in session for callback
             session['discord_user_id'] = discord_user_id
             
@@ -79,22 +104,14 @@ def create_oauth_app():
             
             if not github.authorized:
                 print("GitHub OAuth not authorized")
-                with oauth_sessions_lock:
-                    oauth_sessions[discord_user_id] = {
-                        'status': 'failed',
-                        'error': 'GitHub authorization failed'
-                    }
+                _complete_pending_auth(discord_user_id, None)
                 return "GitHub authorization failed", 400
             
             # Get GitHub user info
             resp = github.get("/user")
             if not resp.ok:
                 print(f"GitHub API call failed: {resp.status_code}")
-                with oauth_sessions_lock:
-                    oauth_sessions[discord_user_id] = {
-                        'status': 'failed',
-                        'error': 'Failed to fetch GitHub user info'
-                    }
+                _complete_pending_auth(discord_user_id, None)
                 return "Failed to fetch GitHub user information", 400
             
             github_user = resp.json()
@@ -102,20 +119,11 @@ def create_oauth_app():
             
             if not github_username:
                 print("No GitHub username found")
-                with oauth_sessions_lock:
-                    oauth_sessions[discord_user_id] = {
-                        'status': 'failed',
-                        'error': 'No GitHub username found'
-                    }
+                _complete_pending_auth(discord_user_id, None)
                 return "Failed to get GitHub username", 400
             
-            # Store successful result
-            with oauth_sessions_lock:
-                oauth_sessions[discord_user_id] = {
-                    'status': 'completed',
-                    'github_username': github_username,
-                    'github_user_data': github_user
-                }
+            # Wake up the waiting /link command
+            _complete_pending_auth(discord_user_id, github_username)
             
             print(f"OAuth completed for {github_username} (Discord: {discord_user_id})")
             
@@ -144,39 +152,8 @@ def create_oauth_app():
 
 def get_github_username_for_user(discord_user_id):
     """Get OAuth URL for a specific Discord user"""
-    base_url = os.getenv("OAUTH_BASE_URL")
+    base_url = get_env("OAUTH_BASE_URL")
     if not base_url:
         raise ValueError("OAUTH_BASE_URL environment variable is required")
     
     return f"{base_url}/auth/start/{discord_user_id}"
-
-def wait_for_username(discord_user_id, max_wait_time=300):
-    """Wait for OAuth completion by polling the status"""
-    start_time = time.time()
-    
-    while time.time() - start_time < max_wait_time:
-        with oauth_sessions_lock:
-            session_data = oauth_sessions.get(discord_user_id)
-            
-            if session_data:
-                if session_data['status'] == 'completed':
-                    github_username = session_data.get('github_username')
-                    # Clean up
-                    del oauth_sessions[discord_user_id]
-                    return github_username
-                elif session_data['status'] == 'failed':
-                    error = session_data.get('error', 'Unknown error')
-                    print(f"OAuth failed for {discord_user_id}: {error}")
-                    # Clean up
-                    del oauth_sessions[discord_user_id]
-                    return None
-        
-        time.sleep(2)  # Poll every 2 seconds
-    
-    print(f"OAuth timeout for Discord user: {discord_user_id}")
-    # Clean up timeout session
-    with oauth_sessions_lock:
-        if discord_user_id in oauth_sessions:
-            del oauth_sessions[discord_user_id]
-    
-    return None
@@ -4,12 +4,11 @@ Discord Bot Module
 Clean, modular Discord bot initialization and setup.
 """
 
-import os
 import sys
 import discord
 from discord.ext import commands
-from dotenv import load_dotenv
 
+from ..utils.env_loader import load_env, get_env
 from .commands import UserCommands, AdminCommands, AnalyticsCommands, NotificationCommands
 
 class DiscordBot:
@@ -28,10 +27,10 @@ class DiscordBot:
         print(f"Python version: {sys.version}")
         print("="*50)
         
-        load_dotenv("config/.env")
+        load_env()
         print("Environment variables loaded")
         
-        self.token = os.getenv("DISCORD_BOT_TOKEN")
+        self.token = get_env("DISCORD_BOT_TOKEN")
         if not self.token:
             raise ValueError("DISCORD_BOT_TOKEN environment variable is required")
     
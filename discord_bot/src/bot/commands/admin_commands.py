@@ -4,9 +4,10 @@ Admin Commands Module
 Handles administrative Discord commands like permissions and setup.
 """
 
+import asyncio
 import discord
 from discord import app_commands
-from shared.firestore import get_document, set_document
+from shared.firestore import get_document, get_documents, set_document
 
 class AdminCommands:
     """Handles administrative Discord commands."""
@@ -85,7 +86,7 @@ class AdminCommands:
             
             try:
                 # Get current reviewer configuration
-                reviewer_data = get_document('pr_config', 'reviewers')
+                reviewer_data = await asyncio.to_thread(get_document, 'pr_config', 'reviewers')
                 if not reviewer_data:
                     reviewer_data = {'reviewers': [], 'manual_reviewers': [], 'top_contributor_reviewers': [], 'count': 0}
                 
@@ -107,7 +108,7 @@ class AdminCommands:
                 reviewer_data['last_updated'] = __import__('time').strftime('%Y-%m-%d %H:%M:%S UTC', __import__('time').gmtime())
                 
                 # Save to Firestore
-                success = set_document('pr_config', 'reviewers', reviewer_data)
+                success = await asyncio.to_thread(set_document, 'pr_config', 'reviewers', reviewer_data)
                 
                 if success:
                     await interaction.followup.send(f"Successfully added `{username}` to the manual reviewer pool.\nTotal reviewers: {len(all_reviewers)}")
@@ -131,7 +132,7 @@ class AdminCommands:
             
             try:
                 # Get current reviewer configuration
-                reviewer_data = get_document('pr_config', 'reviewers')
+                reviewer_data = await asyncio.to_thread(get_document, 'pr_config', 'reviewers')
                 if not reviewer_data or not reviewer_data.get('reviewers'):
                     await interaction.followup.send("No reviewers found in the database.")
                     return
@@ -155,7 +156,7 @@ class AdminCommands:
                     reviewer_data['last_updated'] = __import__('time').strftime('%Y-%m-%d %H:%M:%S UTC', __import__('time').gmtime())
                     
                     # Save to Firestore
-                    success = set_document('pr_config', 'reviewers', reviewer_data)
+                    success = await asyncio.to_thread(set_document, 'pr_config', 'reviewers', reviewer_data)
                     
                     if success:
                         await interaction.followup.send(f"Successfully removed `{username}` from the manual reviewer pool.\nTotal reviewers: {len(all_reviewers)}")
@@ -182,9 +183,11 @@ class AdminCommands:
             await interaction.response.defer()
             
             try:
-                # Get reviewer data
-                reviewer_data = get_document('pr_config', 'reviewers')
-                contributor_data = get_document('repo_stats', 'contributor_summary')
+                # Get reviewer data and contributor summary in one batched read
+                reviewer_data, contributor_data = await asyncio.to_thread(get_documents, [
+                    ('pr_config', 'reviewers'),
+                    ('repo_stats', 'contributor_summary')
+                ])
                 
                 embed = discord.Embed(
                     title="PR Reviewer Pool Status",
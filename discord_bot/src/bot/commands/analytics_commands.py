@@ -4,6 +4,7 @@ Analytics Commands Module
 Handles analytics and visualization-related Discord commands.
 """
 
+import asyncio
 import discord
 from discord import app_commands
 from ...utils.analytics import create_top_contributors_chart, create_activity_comparison_chart, create_activity_trend_chart, create_time_series_chart
@@ -29,7 +30,7 @@ class AnalyticsCommands:
             await interaction.response.defer()
             
             try:
-                analytics_data = get_document('repo_stats', 'analytics')
+                analytics_data = await asyncio.to_thread(get_document, 'repo_stats', 'analytics')
                 
                 if not analytics_data:
                     await interaction.followup.send("No analytics data available for analysis.", ephemeral=True)
@@ -57,7 +58,7 @@ class AnalyticsCommands:
             await interaction.response.defer()
             
             try:
-                analytics_data = get_document('repo_stats', 'analytics')
+                analytics_data = await asyncio.to_thread(get_document, 'repo_stats', 'analytics')
                 
                 if not analytics_data:
                     await interaction.followup.send("No analytics data available for analysis.", ephemeral=True)
@@ -85,7 +86,7 @@ class AnalyticsCommands:
             await interaction.response.defer()
             
             try:
-                analytics_data = get_document('repo_stats', 'analytics')
+                analytics_data = await asyncio.to_thread(get_document, 'repo_stats', 'analytics')
                 
                 if not analytics_data:
                     await interaction.followup.send("No analytics data available for analysis.", ephemeral=True)
@@ -130,7 +131,7 @@ class AnalyticsCommands:
                     await interaction.followup.send("Invalid metrics. Use: prs, issues, commits, total", ephemeral=True)
                     return
                 
-                analytics_data = get_document('repo_stats', 'analytics')
+                analytics_data = await asyncio.to_thread(get_document, 'repo_stats', 'analytics')
                 
                 if not analytics_data:
                     await interaction.followup.send("No analytics data available for analysis.", ephemeral=True)
@@ -4,6 +4,7 @@ Notification Commands Module
 Handles Discord commands for managing GitHub to Discord notifications.
 """
 
+import asyncio
 import discord
 from discord import app_commands
 from typing import Literal
@@ -48,7 +49,7 @@ class NotificationCommands:
                     return
                 
                 # Set the webhook URL
-                success = WebhookManager.set_webhook_url(notification_type, webhook_url)
+                success = await asyncio.to_thread(WebhookManager.set_webhook_url, notification_type, webhook_url)
                 
                 if success:
                     await interaction.followup.send(
@@ -85,7 +86,7 @@ class NotificationCommands:
                     return
                 
                 # Add repository to monitoring list
-                success = WebhookManager.add_monitored_repository(repository)
+                success = await asyncio.to_thread(WebhookManager.add_monitored_repository, repository)
                 
                 if success:
                     await interaction.followup.send(
@@ -121,7 +122,7 @@ class NotificationCommands:
                     return
                 
                 # Remove repository from monitoring list
-                success = WebhookManager.remove_monitored_repository(repository)
+                success = await asyncio.to_thread(WebhookManager.remove_monitored_repository, repository)
                 
                 if success:
                     await interaction.followup.send(
@@ -148,7 +149,7 @@ class NotificationCommands:
             await interaction.response.defer()
             
             try:
-                repositories = WebhookManager.get_monitored_repositories()
+                repositories = await asyncio.to_thread(WebhookManager.get_monitored_repositories)
                 
                 embed = discord.Embed(
                     title="CI/CD Monitoring Status",
@@ -194,7 +195,7 @@ class NotificationCommands:
             try:
                 from shared.firestore import get_document
                 
-                webhook_config = get_document('notification_config', 'webhooks')
+                webhook_config = await asyncio.to_thread(get_document, 'notification_config', 'webhooks')
                 
                 embed = discord.Embed(
                     title="Webhook Configuration Status",
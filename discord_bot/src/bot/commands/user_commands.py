@@ -9,15 +9,42 @@ from discord import app_commands
 import asyncio
 import threading
 from ...services.role_service import RoleService
-from ..auth import get_github_username_for_user, wait_for_username
+from ..auth import get_github_username_for_user, register_pending_auth, cancel_pending_auth
 from shared.firestore import get_document, set_document, query_collection
 
+# How long /link waits for the GitHub OAuth callback
+OAUTH_TIMEOUT_SECONDS = 300
+
+# Display names for hall of fame embeds
+TYPE_NAMES = {"pr": "Pull Requests", "issue": "GitHub Issues Reported", "commit": "Commits"}
+TYPE_NAMES_LOWER = {key: name.lower() for key, name in TYPE_NAMES.items()}
+PERIOD_NAMES = {"all_time": "All Time", "monthly": "Monthly", "weekly": "Weekly", "daily": "Daily"}
+HALL_OF_FAME_TROPHIES = ("🥇", "🥈", "🥉")
+
+# Singular labels used in the /getstats table
+STATS_TITLE_PREFIXES = {"pr": "PR", "issue": "GitHub Issue Reported", "commit": "Commit"}
+
+# Slash-command choices shared by /getstats and /halloffame
+STATS_TYPE_CHOICES = [
+    app_commands.Choice(name=name, value=value) for value, name in TYPE_NAMES.items()
+]
+PERIOD_CHOICES = [
+    app_commands.Choice(name=name, value=value) for value, name in PERIOD_NAMES.items()
+]
+
+# Fields rendered by /getstats - skips the per-date lists and monthly data stored on each user
+STATS_FIELD_PATHS = [
+    'github_id', 'pr_count', 'issues_count', 'commits_count', 'rankings',
+    'stats.pr', 'stats.issue', 'stats.commit', 'stats.last_updated', 'stats.current_month'
+]
+
 class UserCommands:
     """Handles user-related Discord commands."""
     
     def __init__(self, bot):
         self.bot = bot
         self.verification_lock = threading.Lock()
+        self.role_service = RoleService()
     
     def register_commands(self):
         """Register all user commands with the bot."""
@@ -40,14 +67,19 @@ class UserCommands:
                 discord_user_id = str(interaction.user.id)
                 
                 oauth_url = get_github_username_for_user(discord_user_id)
-                await interaction.followup.send(f"Please complete GitHub authentication: {oauth_url}", ephemeral=True)
-
-                github_username = await asyncio.get_event_loop().run_in_executor(
-                    None, wait_for_username, discord_user_id
-                )
+                auth_future = register_pending_auth(discord_user_id)
+                try:
+                    await interaction.followup.send(f"Please complete GitHub authentication: {oauth_url}", ephemeral=True)
+                    github_username = await asyncio.wait_for(auth_future, timeout=OAUTH_TIMEOUT_SECONDS)
+                except asyncio.TimeoutError:
+                    print(f"OAuth timeout for Discord user: {discord_user_id}")
+                    github_username = None
+                finally:
+                    # Never leave the (loop, future) entry behind, whether we timed out, failed or were cancelled
+                    cancel_pending_auth(discord_user_id)
 
                 if github_username:
-                    set_document('discord', discord_user_id, {
+                    await asyncio.to_thread(set_document, 'discord', discord_user_id, {
                         'github_id': github_username,
                         'pr_count': 0,
                         'issues_count': 0,
@@ -73,11 +105,11 @@ class UserCommands:
             try:
                 await interaction.response.defer(ephemeral=True)
 
-                user_data = get_document('discord', str(interaction.user.id))
+                user_data = await asyncio.to_thread(get_document, 'discord', str(interaction.user.id))
 
                 if user_data:
                     # Delete document by setting it to empty (Firestore will remove it)
-                    set_document('discord', str(interaction.user.id), {})
+                    await asyncio.to_thread(set_document, 'discord', str(interaction.user.id), {})
                     await interaction.followup.send(
                         "Successfully unlinked your Discord account from your GitHub username.",
                         ephemeral=True
@@ -99,11 +131,7 @@ class UserCommands:
         """Create the getstats command."""
         @app_commands.command(name="getstats", description="Displays your GitHub stats and current role")
         @app_commands.describe(type="Type of stats to display")
-        @app_commands.choices(type=[
-            app_commands.Choice(name="Pull Requests", value="pr"),
-            app_commands.Choice(name="GitHub Issues Reported", value="issue"),
-            app_commands.Choice(name="Commits", value="commit")
-        ])
+        @app_commands.choices(type=STATS_TYPE_CHOICES)
         async def getstats(interaction: discord.Interaction, type: str = "pr"):
             await interaction.response.defer()
             
@@ -115,7 +143,7 @@ class UserCommands:
                 user_id = str(interaction.user.id)
                 
                 # Get user's Discord data to find their GitHub username
-                discord_user_data = get_document('discord', user_id)
+                discord_user_data = await asyncio.to_thread(get_document, 'discord', user_id, field_paths=STATS_FIELD_PATHS)
                 if not discord_user_data or not discord_user_data.get('github_id'):
                     await interaction.followup.send(
                         "Your Discord account is not linked to a GitHub username. Use `/link` to link it.",
@@ -152,21 +180,14 @@ class UserCommands:
         """Create the halloffame command."""
         @app_commands.command(name="halloffame", description="Shows top 3 contributors")
         @app_commands.describe(type="Contribution type", period="Time period")
-        @app_commands.choices(type=[
-            app_commands.Choice(name="Pull Requests", value="pr"),
-            app_commands.Choice(name="GitHub Issues Reported", value="issue"),
-            app_commands.Choice(name="Commits", value="commit")
-        ])
-        @app_commands.choices(period=[
-            app_commands.Choice(name="All Time", value="all_time"),
-            app_commands.Choice(name="Monthly", value="monthly"),
-            app_commands.Choice(name="Weekly", value="weekly"),
-            app_commands.Choice(name="Daily", value="daily")
-        ])
+        @app_commands.choices(type=STATS_TYPE_CHOICES)
+        @app_commands.choices(period=PERIOD_CHOICES)
         async def halloffame(interaction: discord.Interaction, type: str = "pr", period: str = "all_time"):
             await interaction.response.defer()
             
-            hall_of_fame_data = get_document('repo_stats', 'hall_of_fame')
+            hall_of_fame_data = await asyncio.to_thread(
+                get_document, 'repo_stats', 'hall_of_fame', field_paths=[f'{type}.{period}', 'last_updated']
+            )
             
             if not hall_of_fame_data:
                 await interaction.followup.send("Hall of fame data not available yet.", ephemeral=True)
@@ -187,7 +208,7 @@ class UserCommands:
         """Create stats embed for user."""
         import datetime
         
-        role_service = RoleService()
+        role_service = self.role_service
         
         # Get stats from the detailed structure if available
         pr_all_time = user_data.get("stats", {}).get("pr", {}).get("all_time", user_data.get("pr_count", 0))
@@ -197,26 +218,12 @@ class UserCommands:
         pr_role, issue_role, commit_role = role_service.determine_roles(pr_all_time, issues_all_time, commits_all_time)
         
         # Set up type-specific variables
-        title_prefix = "PR"
-        if stats_type == "pr":
-            count_field = "pr_count"
-            stats_field = "pr"
-            role = pr_role
-            title_prefix = "PR"
-        elif stats_type == "issue":
-            count_field = "issues_count"
-            stats_field = "issue"
-            role = issue_role if issue_role else "None"
-            title_prefix = "GitHub Issue Reported"
-        elif stats_type == "commit":
-            count_field = "commits_count"
-            stats_field = "commit"
-            role = commit_role if commit_role else "None"
-            title_prefix = "Commit"
+        role = {"pr": pr_role, "issue": issue_role, "commit": commit_role}[stats_type] or "None"
+        title_prefix = STATS_TITLE_PREFIXES[stats_type]
  
         # Get enhanced stats
         stats = user_data["stats"]
-        type_stats = stats[stats_field]
+        type_stats = stats[stats_type]
         
         # Create enhanced embed
         embed = discord.Embed(
@@ -227,16 +234,21 @@ class UserCommands:
         
         # Create stats table with customized format
         display_prefix = f"{title_prefix}s{' ' * (12 - len(title_prefix + 's'))}"
-        stats_table = f"```\n{display_prefix}   Count   Ranking\n"
-        stats_table += f"24h:           {type_stats.get('daily', 0):<8}#{user_data.get('rankings', {}).get(f'{stats_type}_daily', 0)}\n"
-        stats_table += f"7 days:        {type_stats.get('weekly', 0):<8}#{user_data.get('rankings', {}).get(f'{stats_type}_weekly', 0)}\n"
-        stats_table += f"30 days:       {type_stats.get('monthly', 0):<8}#{user_data.get('rankings', {}).get(f'{stats_type}_monthly', 0)}\n"
-        stats_table += f"Lifetime:      {type_stats.get('all_time', 0):<8}#{user_data.get('rankings', {}).get(stats_type, 0)}\n\n"
-        
-        # Add averages and streaks with customized wording
-        stats_table += f"Daily Average ({stats.get('current_month', 'June')}): {type_stats.get('avg_per_day', 0)} {title_prefix}s\n\n"
-        stats_table += f"Active {title_prefix} Streak: {type_stats.get('current_streak', 0)} {title_prefix}s\n"
-        stats_table += f"Best {title_prefix} Streak: {type_stats.get('longest_streak', 0)} {title_prefix}s\n```"
+        rankings = user_data.get('rankings', {})
+        stats_lines = [
+            f"{display_prefix}   Count   Ranking",
+            f"24h:           {type_stats.get('daily', 0):<8}#{rankings.get(f'{stats_type}_daily', 0)}",
+            f"7 days:        {type_stats.get('weekly', 0):<8}#{rankings.get(f'{stats_type}_weekly', 0)}",
+            f"30 days:       {type_stats.get('monthly', 0):<8}#{rankings.get(f'{stats_type}_monthly', 0)}",
+            f"Lifetime:      {type_stats.get('all_time', 0):<8}#{rankings.get(stats_type, 0)}",
+            "",
+            # Add averages and streaks with customized wording
+            f"Daily Average ({stats.get('current_month', 'June')}): {type_stats.get('avg_per_day', 0)} {title_prefix}s",
+            "",
+            f"Active {title_prefix} Streak: {type_stats.get('current_streak', 0)} {title_prefix}s",
+            f"Best {title_prefix} Streak: {type_stats.get('longest_streak', 0)} {title_prefix}s",
+        ]
+        stats_table = "```\n" + "\n".join(stats_lines) + "\n```"
         
         # Add level information based on role
         embed.add_field(name="Statistics", value=stats_table, inline=False)
@@ -269,21 +281,18 @@ class UserCommands:
         return embed 
     def _create_halloffame_embed(self, top_3, type, period, last_updated):
         """Create hall of fame embed."""
-        type_names = {"pr": "Pull Requests", "issue": "GitHub Issues Reported", "commit": "Commits"}
-        period_names = {"all_time": "All Time", "monthly": "Monthly", "weekly": "Weekly", "daily": "Daily"}
-        
         embed = discord.Embed(
-            title=f"{type_names[type]} Hall of Fame ({period_names[period]})",
+            title=f"{TYPE_NAMES[type]} Hall of Fame ({PERIOD_NAMES[period]})",
             color=discord.Color.gold()
         )
         
-        trophies = ["🥇", "🥈", "🥉"]
-        for i, contributor in enumerate(top_3[:3]):
+        type_name_lower = TYPE_NAMES_LOWER[type]
+        for trophy, contributor in zip(HALL_OF_FAME_TROPHIES, top_3):
             username = contributor.get('username', 'Unknown')
             count = contributor.get('count', 0)  # Changed from 'value' to 'count' to match new structure
             embed.add_field(
-                name=f"{trophies[i]} {username}",
-                value=f"{count} {type_names[type].lower()}",
+                name=f"{trophy} {username}",
+                value=f"{count} {type_name_lower}",
                 inline=False
             )
         
@@ -10,11 +10,11 @@ from src.services.role_service import RoleService
 from src.services.notification_service import NotificationService
 
 from shared.firestore import (
-    get_document, set_document, update_document, query_collection
+    get_document, get_documents, set_document, update_document, batch_update, batch_set, query_collection, query_where
 )
 
 __all__ = [
-    'get_document', 'set_document', 'update_document', 'query_collection',
+    'get_document', 'get_documents', 'set_document', 'update_document', 'batch_update', 'batch_set', 'query_collection', 'query_where',
     'GuildService',
     'GitHubService', 
     'RoleService',
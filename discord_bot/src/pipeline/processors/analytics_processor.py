@@ -4,6 +4,7 @@ Analytics Processing Functions
 Simple functions for creating analytics data and hall of fame from contribution data.
 """
 
+import heapq
 import time
 
 def create_hall_of_fame_data(all_contributions):
@@ -19,11 +20,11 @@ def create_hall_of_fame_data(all_contributions):
     
     def create_leaderboard_for_period(contrib_type, period):
         """Create a leaderboard for a specific contribution type and time period."""
-        sorted_contributors = sorted(
+        sorted_contributors = heapq.nlargest(
+            leaderboard_size,
             contributors,
-            key=lambda x: all_contributions[x]['stats'][contrib_type][period],
-            reverse=True
-        )[:leaderboard_size]
+            key=lambda x: all_contributions[x]['stats'][contrib_type][period]
+        )
         
         return [
             {
@@ -51,36 +52,35 @@ def create_analytics_data(all_contributions):
     if not all_contributions:
         return {}
     
-    # Basic statistics
+    # Basic statistics and activity trends, accumulated in a single pass
     total_contributors = len(all_contributions)
-    total_prs = sum(contrib.get('pr_count', 0) for contrib in all_contributions.values())
-    total_issues = sum(contrib.get('issues_count', 0) for contrib in all_contributions.values())
-    total_commits = sum(contrib.get('commits_count', 0) for contrib in all_contributions.values())
+    total_prs = total_issues = total_commits = 0
+    active_contributors = 0
+    trend_types = (('prs', 'pr'), ('issues', 'issue'), ('commits', 'commit'))
+    activity_trends = {
+        period: {trend_key: 0 for trend_key, _ in trend_types}
+        for period in ('daily', 'weekly', 'monthly')
+    }
     
-    # Active contributors (those with recent activity)
-    active_contributors = len([
-        c for c in all_contributions.values()
-        if c.get('week_activity', 0) > 0
-    ])
+    for contrib in all_contributions.values():
+        total_prs += contrib.get('pr_count', 0)
+        total_issues += contrib.get('issues_count', 0)
+        total_commits += contrib.get('commits_count', 0)
+        
+        # Active contributors (those with recent activity)
+        if contrib.get('week_activity', 0) > 0:
+            active_contributors += 1
+        
+        stats = contrib.get('stats', {})
+        for trend_key, contrib_type in trend_types:
+            type_stats = stats.get(contrib_type, {})
+            for period, period_totals in activity_trends.items():
+                period_totals[trend_key] += type_stats.get(period, 0)
     
     # Convert tuples to dictionaries for Firestore compatibility
-    top_prs = sorted(
-        all_contributions.items(),
-        key=lambda x: x[1].get('pr_count', 0),
-        reverse=True
-    )[:5]
-    
-    top_issues = sorted(
-        all_contributions.items(),
-        key=lambda x: x[1].get('issues_count', 0),
-        reverse=True
-    )[:5]
-    
-    top_commits = sorted(
-        all_contributions.items(),
-        key=lambda x: x[1].get('commits_count', 0),
-        reverse=True
-    )[:5]
+    top_prs = heapq.nlargest(5, all_contributions.items(), key=lambda x: x[1].get('pr_count', 0))
+    top_issues = heapq.nlargest(5, all_contributions.items(), key=lambda x: x[1].get('issues_count', 0))
+    top_commits = heapq.nlargest(5, all_contributions.items(), key=lambda x: x[1].get('commits_count', 0))
     
     return {
         'summary': {
@@ -114,23 +114,7 @@ def create_analytics_data(all_contributions):
             }
             for username, data in top_commits
         ],
-        'activity_trends': {
-            'daily': {
-                'prs': sum(c.get('stats', {}).get('pr', {}).get('daily', 0) for c in all_contributions.values()),
-                'issues': sum(c.get('stats', {}).get('issue', {}).get('daily', 0) for c in all_contributions.values()),
-                'commits': sum(c.get('stats', {}).get('commit', {}).get('daily', 0) for c in all_contributions.values())
-            },
-            'weekly': {
-                'prs': sum(c.get('stats', {}).get('pr', {}).get('weekly', 0) for c in all_contributions.values()),
-                'issues': sum(c.get('stats', {}).get('issue', {}).get('weekly', 0) for c in all_contributions.values()),
-                'commits': sum(c.get('stats', {}).get('commit', {}).get('weekly', 0) for c in all_contributions.values())
-            },
-            'monthly': {
-                'prs': sum(c.get('stats', {}).get('pr', {}).get('monthly', 0) for c in all_contributions.values()),
-                'issues': sum(c.get('stats', {}).get('issue', {}).get('monthly', 0) for c in all_contributions.values()),
-                'commits': sum(c.get('stats', {}).get('commit', {}).get('monthly', 0) for c in all_contributions.values())
-            }
-        },
+        'activity_trends': activity_trends,
         'activity_comparison': [
             {
                 'username': username,
@@ -138,11 +122,11 @@ def create_analytics_data(all_contributions):
                 'issues_count': data.get('issues_count', 0),
                 'commits_count': data.get('commits_count', 0)
             }
-            for username, data in sorted(
+            for username, data in heapq.nlargest(
+                10,
                 all_contributions.items(),
-                key=lambda x: x[1].get('total_activity', 0),
-                reverse=True
-            )[:10]
+                key=lambda x: x[1].get('total_activity', 0)
+            )
         ],
         'time_series': _create_time_series_data(all_contributions),
         'last_updated': time.strftime('%Y-%m-%d %H:%M:%S UTC', time.gmtime())
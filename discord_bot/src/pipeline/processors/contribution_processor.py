@@ -5,6 +5,7 @@ Simple functions for processing raw GitHub data into structured contribution dat
 """
 
 from datetime import datetime, timedelta
+import numpy as np
 
 # Global date constants
 now = datetime.now()
@@ -42,7 +43,8 @@ def _process_repository(repo_data, all_contributions):
             continue
         
         _initialize_user_if_needed(username, all_contributions)
-        _process_user_contributions(username, pull_requests, issues, commits, all_contributions)
+    
+    _process_contributions(pull_requests, issues, commits, all_contributions)
 
 def _extract_usernames(contributors, pull_requests, issues, commits):
     """Extract all unique usernames from various data sources."""
@@ -121,111 +123,95 @@ def _initialize_user_if_needed(username, all_contributions):
             'rankings': {}
         }
 
-def _process_user_contributions(username, pull_requests, issues, commits, all_contributions):
-    """Process all contributions for a single user."""
-    user_data = all_contributions[username]
-    
+def _process_contributions(pull_requests, issues, commits, all_contributions):
+    """Attribute each PR, issue and commit to its author in a single pass over the repository's items."""
     # Process PRs
     for pr in pull_requests:
-        if pr and pr.get('user') and pr['user'].get('login') == username:
-            user_data['pr_count'] += 1
-            user_data['stats']['pr']['all_time'] += 1
-            created_at = pr.get('created_at', '')
-            _update_activity_counts(created_at, user_data)
-            _update_time_based_stats(created_at, user_data['stats']['pr'])
-            
-            # Store date for streak calculation
-            if created_at:
-                date_str = created_at.split('T')[0]
-                user_data['pr_dates'].append(date_str)
-            
-            if pr.get('repository') and pr['repository'].get('name'):
-                repo_name = pr['repository']['name']
-                user_data['repositories'].add(repo_name)
+        username = pr and pr.get('user') and pr['user'].get('login')
+        if not username:
+            continue
+        
+        user_data = all_contributions[username]
+        user_data['pr_count'] += 1
+        user_data['stats']['pr']['all_time'] += 1
+        created_at = pr.get('created_at', '')
+        _update_activity(created_at, user_data, user_data['stats']['pr'])
+        
+        # Store date for streak calculation
+        if created_at:
+            date_str = created_at.split('T')[0]
+            user_data['pr_dates'].append(date_str)
+        
+        if pr.get('repository') and pr['repository'].get('name'):
+            repo_name = pr['repository']['name']
+            user_data['repositories'].add(repo_name)
     
     # Process issues
     for issue in issues:
-        if issue and issue.get('user') and issue['user'].get('login') == username:
-            if not issue.get('pull_request'):  # Exclude PRs counted as issues
-                user_data['issues_count'] += 1
-                user_data['stats']['issue']['all_time'] += 1
-                created_at = issue.get('created_at', '')
-                _update_activity_counts(created_at, user_data)
-                _update_time_based_stats(created_at, user_data['stats']['issue'])
-                
-                # Store date for streak calculation
-                if created_at:
-                    date_str = created_at.split('T')[0]
-                    user_data['issue_dates'].append(date_str)
+        username = issue and issue.get('user') and issue['user'].get('login')
+        if not username or issue.get('pull_request'):  # Exclude PRs counted as issues
+            continue
+        
+        user_data = all_contributions[username]
+        user_data['issues_count'] += 1
+        user_data['stats']['issue']['all_time'] += 1
+        created_at = issue.get('created_at', '')
+        _update_activity(created_at, user_data, user_data['stats']['issue'])
+        
+        # Store date for streak calculation
+        if created_at:
+            date_str = created_at.split('T')[0]
+            user_data['issue_dates'].append(date_str)
     
     # Process commits
     for commit in commits:
-        if commit and commit.get('author') and commit['author'].get('login') == username:
-            user_data['commits_count'] += 1
-            user_data['stats']['commit']['all_time'] += 1
-            # Safe nested access for commit date
-            commit_obj = commit.get('commit')
-            if commit_obj and commit_obj.get('author'):
-                commit_date = commit_obj['author'].get('date', '')
-                _update_activity_counts(commit_date, user_data)
-                _update_time_based_stats(commit_date, user_data['stats']['commit'])
-                
-                # Store date for streak calculation
-                if commit_date:
-                    date_str = commit_date.split('T')[0]
-                    user_data['commit_dates'].append(date_str)
-
-def _update_activity_counts(date_str, user_data):
-    """Update activity counters based on date."""
-    if not date_str:
-        return
-        
-    try:
-        activity_date = datetime.fromisoformat(date_str.replace('Z', '+00:00')).strftime('%Y-%m-%d')
-        
-        user_data['total_activity'] += 1
+        username = commit and commit.get('author') and commit['author'].get('login')
+        if not username:
+            continue
         
-        if activity_date == today_date:
-            user_data['today_activity'] += 1
-        elif activity_date == yesterday_date:
-            user_data['yesterday_activity'] += 1
-            
-        if activity_date >= week_ago_date:
-            user_data['week_activity'] += 1
+        user_data = all_contributions[username]
+        user_data['commits_count'] += 1
+        user_data['stats']['commit']['all_time'] += 1
+        # Safe nested access for commit date
+        commit_obj = commit.get('commit')
+        if commit_obj and commit_obj.get('author'):
+            commit_date = commit_obj['author'].get('date', '')
+            _update_activity(commit_date, user_data, user_data['stats']['commit'])
             
-        if activity_date >= month_ago_date:
-            user_data['month_activity'] += 1
-            
-        # Monthly tracking
-        activity_datetime = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        month_key = activity_datetime.strftime('%Y-%m')
-        
-        if month_key not in user_data['monthly_data']:
-            user_data['monthly_data'][month_key] = 0
-        user_data['monthly_data'][month_key] += 1
-        
-    except (ValueError, AttributeError):
-        pass
+            # Store date for streak calculation
+            if commit_date:
+                date_str = commit_date.split('T')[0]
+                user_data['commit_dates'].append(date_str)
 
-def _update_time_based_stats(date_str, stats_dict):
-    """Update time-based stats (daily, weekly, monthly) based on date."""
+def _update_activity(date_str, user_data, stats_dict):
+    """Update the user's activity counters and the type's time-based stats, parsing the date once."""
     if not date_str:
         return
     
     try:
         activity_date = datetime.fromisoformat(date_str.replace('Z', '+00:00')).strftime('%Y-%m-%d')
-        
-        if activity_date == today_date:
-            stats_dict['daily'] += 1
-        
-        if activity_date >= week_ago_date:
-            stats_dict['weekly'] += 1
-            
-        if activity_date >= month_ago_date:
-            stats_dict['monthly'] += 1
-            
     except (ValueError, AttributeError):
-        pass
+        return
+    
+    user_data['total_activity'] += 1
+    
+    if activity_date == today_date:
+        user_data['today_activity'] += 1
+        stats_dict['daily'] += 1
+    elif activity_date == yesterday_date:
+        user_data['yesterday_activity'] += 1
+    
+    if activity_date >= week_ago_date:
+        user_data['week_activity'] += 1
+        stats_dict['weekly'] += 1
+    
+    if activity_date >= month_ago_date:
+        user_data['month_activity'] += 1
+        stats_dict['monthly'] += 1
+    
+    # Monthly tracking
+    month_key = activity_date[:7]
+    user_data['monthly_data'][month_key] = user_data['monthly_data'].get(month_key, 0) + 1
 
 def calculate_rankings(contributions):
     """Calculate rankings for all contributors."""
@@ -234,29 +220,37 @@ def calculate_rankings(contributions):
     if not contributions:
         return contributions
     
-    # Define ranking categories
+    # Define ranking categories as (contribution type, stats period)
     ranking_categories = {
-        'pr': lambda x: x[1]['stats']['pr']['all_time'],
-        'issue': lambda x: x[1]['stats']['issue']['all_time'],
-        'commit': lambda x: x[1]['stats']['commit']['all_time'],
-        'pr_daily': lambda x: x[1]['stats']['pr']['daily'],
-        'pr_weekly': lambda x: x[1]['stats']['pr']['weekly'],
-        'pr_monthly': lambda x: x[1]['stats']['pr']['monthly'],
-        'issue_daily': lambda x: x[1]['stats']['issue']['daily'],
-        'issue_weekly': lambda x: x[1]['stats']['issue']['weekly'],
-        'issue_monthly': lambda x: x[1]['stats']['issue']['monthly'],
-        'commit_daily': lambda x: x[1]['stats']['commit']['daily'],
-        'commit_weekly': lambda x: x[1]['stats']['commit']['weekly'],
-        'commit_monthly': lambda x: x[1]['stats']['commit']['monthly'],
+        'pr': ('pr', 'all_time'),
+        'issue': ('issue', 'all_time'),
+        'commit': ('commit', 'all_time'),
+        'pr_daily': ('pr', 'daily'),
+        'pr_weekly': ('pr', 'weekly'),
+        'pr_monthly': ('pr', 'monthly'),
+        'issue_daily': ('issue', 'daily'),
+        'issue_weekly': ('issue', 'weekly'),
+        'issue_monthly': ('issue', 'monthly'),
+        'commit_daily': ('commit', 'daily'),
+        'commit_weekly': ('commit', 'weekly'),
+        'commit_monthly': ('commit', 'monthly'),
     }
     
-    # Calculate rankings for each category
-    for rank_name, sort_key in ranking_categories.items():
-        sorted_contributors = sorted(contributions.items(), key=sort_key, reverse=True)
-        for rank, (username, data) in enumerate(sorted_contributors, 1):
-            if 'rankings' not in data:
-                data['rankings'] = {}
-            data['rankings'][rank_name] = rank
+    all_data = list(contributions.values())
+    rankings = [data.setdefault('rankings', {}) for data in all_data]
+    positions = np.arange(1, len(all_data) + 1)
+    
+    # Calculate rankings for each category; a stable sort on negated counts keeps ties in insertion order
+    for rank_name, (contrib_type, period) in ranking_categories.items():
+        counts = np.fromiter(
+            (data['stats'][contrib_type][period] for data in all_data),
+            dtype=np.int64,
+            count=len(all_data)
+        )
+        ranks = np.empty_like(positions)
+        ranks[np.argsort(-counts, kind='stable')] = positions
+        for user_rankings, rank in zip(rankings, ranks.tolist()):
+            user_rankings[rank_name] = rank
     
     return contributions
 
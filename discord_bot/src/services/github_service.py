@@ -4,12 +4,89 @@ GitHub Service
 Handles all GitHub API interactions following Single Responsibility Principle.
 """
 
+import orjson
+import re
 import requests
+import shelve
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
+from urllib.parse import urlparse, parse_qs, urlencode
+from requests.adapters import HTTPAdapter
+from requests.utils import parse_header_links
+from urllib3.util.retry import Retry
 import os
 
+# Repository metadata, merged PRs, issues and default-branch commits in one paginated query.
+# Each connection is only requested while it still has pages left.
+REPOSITORY_BUNDLE_QUERY = """
+query($owner: String!, $name: String!,
+      $prCursor: String, $issueCursor: String, $commitCursor: String,
+      $withPrs: Boolean!, $withIssues: Boolean!, $withCommits: Boolean!) {
+  repository(owner: $owner, name: $name) {
+    name
+    nameWithOwner
+    stargazerCount
+    forkCount
+    pullRequests(states: MERGED, first: 100, after: $prCursor) @include(if: $withPrs) {
+      totalCount
+      pageInfo { hasNextPage endCursor }
+      nodes { number createdAt author { __typename login } }
+    }
+    issues(first: 100, after: $issueCursor) @include(if: $withIssues) {
+      totalCount
+      pageInfo { hasNextPage endCursor }
+      nodes { number createdAt author { __typename login } }
+    }
+    defaultBranchRef {
+      target {
+        ... on Commit {
+          history(first: 100, after: $commitCursor) @include(if: $withCommits) {
+            totalCount
+            pageInfo { hasNextPage endCursor }
+            nodes { oid author { date email user { login } } }
+          }
+        }
+      }
+    }
+  }
+}
+"""
+
+# Rate limit status is printed at most once per interval unless a budget drops below the threshold
+RATE_LIMIT_LOG_INTERVAL = 60
+RATE_LIMIT_LOG_THRESHOLD = 100
+
+# Below this many remaining requests, calls are paced across the time left until reset
+RATE_LIMIT_PACE_THRESHOLD = 20
+
+# Minimum spacing between REST requests per bucket; search allows 30 requests a minute
+MIN_REQUEST_INTERVAL = {'core': 0.1, 'search': 2.0}
+
+# Secondary rate limits without Retry-After are waited out for a minute, doubling per retry
+SECONDARY_RATE_LIMIT_WAIT = 60
+
+# Rate limit backoffs longer than this give up instead of stalling the collection
+MAX_RATE_LIMIT_WAIT = 300
+
+# Attempts per GraphQL page after the first one succeeded, before falling back to REST
+GRAPHQL_PAGE_ATTEMPTS = 3
+
+# Archived repositories are re-collected after this many seconds even if unchanged
+ARCHIVED_REPO_CACHE_TTL = 7 * 24 * 3600
+
+# GitHub noreply commit emails ("<id>+<login>@users.noreply.github.com"), used by bots and private-email users
+NOREPLY_EMAIL_PATTERN = re.compile(r'^(?:\d+\+)?([^@]+)@users\.noreply\.github\.com$', re.IGNORECASE)
+
+@lru_cache(maxsize=8)
+def _format_reset_time(reset: int) -> str:
+    """Format a rate limit reset epoch as HH:MM:SS; resets change at most hourly."""
+    return datetime.fromtimestamp(reset).strftime('%H:%M:%S')
+
 class GitHubService:
     """GitHub API service for data collection."""
     
@@ -17,28 +94,71 @@ class GitHubService:
         self.api_url = "https://api.github.com"
         self.token = os.getenv('GITHUB_TOKEN')
         self.repo_owner = os.getenv('REPO_OWNER', 'ruxailab')
+        self.max_concurrent_repos = 4
         
         if not self.token:
             raise ValueError("GITHUB_TOKEN environment variable is required")
         
         self._request_count = 0
-    
-    def _get_headers(self) -> Dict[str, str]:
-        """Get GitHub API headers with authentication."""
-        return {
+        self._request_count_lock = threading.Lock()
+        
+        # Persistent session so the hundreds of collection calls reuse pooled keep-alive connections
+        self._session = requests.Session()
+        # Transient server errors and connection failures are retried with backoff inside urllib3
+        retry = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        self._session.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry))
+        
+        # The token never changes, so build the auth headers once and let the session send them
+        self._headers = {
             "Authorization": f"token {self.token}",
             "Accept": "application/vnd.github.v3+json"
         }
+        self._session.headers.update(self._headers)
+        
+        # Last known rate limit state per resource, refreshed from every response's headers
+        self._rate_limits: Dict[str, Dict[str, Any]] = {}
+        self._last_rate_limit_log = float('-inf')
+        
+        # Cap in-flight requests per rate limit bucket when fetching concurrently
+        self._rate_semaphores = {
+            'core': threading.BoundedSemaphore(8),
+            'search': threading.BoundedSemaphore(2)
+        }
+        # Earliest monotonic time the next request per bucket may start
+        self._next_request_at: Dict[str, float] = {}
+        self._throttle_lock = threading.Lock()
+        
+        # On-disk {url: (etag, body, link)} cache; 304 Not Modified replies don't count against the rate limit
+        self._etag_cache_path = os.getenv(
+            'GITHUB_ETAG_CACHE', os.path.join(tempfile.gettempdir(), 'disgitbot_github_etags')
+        )
+        self._etag_lock = threading.Lock()
+        os.makedirs(os.path.dirname(os.path.abspath(self._etag_cache_path)), exist_ok=True)
+        
+        # Last collected data of archived repositories, kept next to the ETag cache; archived repos are read-only
+        self._archive_cache_path = f"{self._etag_cache_path}_archived_repos"
+        self._archive_lock = threading.Lock()
+    
+    def _get_headers(self) -> Dict[str, str]:
+        """Get GitHub API headers with authentication."""
+        return self._headers
     
     def _check_rate_limit(self) -> Optional[Dict[str, Any]]:
         """Check GitHub API rate limit status with detailed logging."""
-        response = requests.get(f"{self.api_url}/rate_limit", headers=self._get_headers())
+        response = self._session.get(f"{self.api_url}/rate_limit")
         
         if response.status_code != 200:
             print(f"DEBUG - Rate limit check failed: {response.status_code} - {response.text}")
             return None
         
-        data = response.json()
+        data = orjson.loads(response.content)
         resources = data.get('resources', {})
         core_limit = resources.get('core', {})
         search_limit = resources.get('search', {})
@@ -51,94 +171,238 @@ class GitHubService:
         search_total = search_limit.get('limit', 0)
         search_reset = search_limit.get('reset', 0)
         
-        core_reset_time = datetime.fromtimestamp(core_reset).strftime('%H:%M:%S')
-        search_reset_time = datetime.fromtimestamp(search_reset).strftime('%H:%M:%S')
+        # Only report when a budget is running low or the last report is stale
+        now = time.monotonic()
+        running_low = min(core_remaining, search_remaining) < RATE_LIMIT_LOG_THRESHOLD
+        if running_low or now - self._last_rate_limit_log >= RATE_LIMIT_LOG_INTERVAL:
+            self._last_rate_limit_log = now
+            core_reset_time = _format_reset_time(int(core_reset))
+            search_reset_time = _format_reset_time(int(search_reset))
+            
+            print(f"GitHub API Rate Limits:")
+            print(f"Core: {core_remaining}/{core_total} - Reset at: {core_reset_time}")
+            print(f"Search: {search_remaining}/{search_total} - Reset at: {search_reset_time}")
         
-        print(f"GitHub API Rate Limits:")
-        print(f"Core: {core_remaining}/{core_total} - Reset at: {core_reset_time}")
-        print(f"Search: {search_remaining}/{search_total} - Reset at: {search_reset_time}")
+        for rate_type, limit_data in resources.items():
+            self._rate_limits[rate_type] = {
+                'remaining': limit_data.get('remaining', 0),
+                'reset': limit_data.get('reset', 0)
+            }
         
         return {
             'core': core_limit,
             'search': search_limit
         }
     
+    def _update_rate_limits(self, response: requests.Response) -> None:
+        """Record the rate limit state GitHub reports on every API response."""
+        headers = response.headers
+        remaining = headers.get('X-RateLimit-Remaining')
+        reset = headers.get('X-RateLimit-Reset')
+        rate_type = headers.get('X-RateLimit-Resource')
+        
+        if remaining is None or reset is None or not rate_type:
+            return
+        
+        try:
+            self._rate_limits[rate_type] = {'remaining': int(remaining), 'reset': int(reset)}
+        except ValueError:
+            pass
+    
     def _wait_for_rate_limit(self, rate_type: str = 'search', min_remaining: int = 5) -> bool:
         """Wait for rate limit reset if necessary."""
-        limits = self._check_rate_limit()
-        if not limits:
-            print("DEBUG - Unable to check rate limits, proceeding with caution")
-            time.sleep(2)
-            return True
+        limit_data = self._rate_limits.get(rate_type)
         
-        limit_data = limits.get(rate_type, {})
-        remaining = limit_data.get('remaining', 0)
-        reset_time = limit_data.get('reset', 0)
+        # Only hit /rate_limit when we have no headers yet or the budget looks exhausted
+        if limit_data is None or limit_data['remaining'] <= min_remaining:
+            limits = self._check_rate_limit()
+            if not limits:
+                print("DEBUG - Unable to check rate limits, proceeding with caution")
+                time.sleep(2)
+                return True
+            limit_data = self._rate_limits.get(rate_type, {'remaining': 0, 'reset': 0})
+        
+        remaining = limit_data['remaining']
+        reset_time = limit_data['reset']
         
         if remaining <= min_remaining:
             current_time = datetime.now().timestamp()
             wait_seconds = max(1, reset_time - current_time + 2)
             
-            reset_datetime = datetime.fromtimestamp(reset_time)
             print(f"\nRate limit for {rate_type} API almost exhausted ({remaining} remaining).")
-            print(f"Waiting until reset at {reset_datetime.strftime('%H:%M:%S')} ({int(wait_seconds)} seconds)...")
+            print(f"Waiting until reset at {_format_reset_time(int(reset_time))} ({int(wait_seconds)} seconds)...")
             
             if wait_seconds > 60:
                 print("WARNING: Long wait time required for rate limits")
                 return False
             
             time.sleep(wait_seconds)
+            # Budget has been replenished; re-probe on the next request
+            self._rate_limits.pop(rate_type, None)
             print("Continuing after rate limit reset.")
             return True
         
+        if remaining < RATE_LIMIT_PACE_THRESHOLD:
+            self._pace(remaining, reset_time)
+        
         return True
     
-    def _make_request(self, url: str, rate_type: str = 'search', retries: int = 3) -> Optional[requests.Response]:
-        """Make GitHub API request with comprehensive error handling and rate limiting."""
-        self._request_count += 1
+    def _pace(self, remaining: int, reset_time: float) -> None:
+        """Spread a nearly spent budget over the time left until reset instead of draining it at once."""
+        seconds_left = max(1, reset_time - time.time())
+        delay = seconds_left / max(1, remaining)
+        if delay > 0.1:
+            time.sleep(min(delay, 1.0))
+    
+    def _throttle(self, rate_type: str) -> None:
+        """Keep at least MIN_REQUEST_INTERVAL between requests of a bucket, even when concurrent."""
+        interval = MIN_REQUEST_INTERVAL.get(rate_type, 0)
+        with self._throttle_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_at.get(rate_type, now))
+            self._next_request_at[rate_type] = slot + interval
+        if slot > now:
+            time.sleep(slot - now)
+    
+    def _rate_limit_backoff(self, response: requests.Response, attempt: int) -> Optional[float]:
+        """Return seconds to back off if a 403/429 reply is a primary or secondary rate limit, else None."""
+        if response.status_code not in (403, 429):
+            return None
+        
+        retry_after = response.headers.get('Retry-After')
+        if retry_after is not None:
+            try:
+                return max(1.0, float(retry_after))
+            except ValueError:
+                pass
         
-        print(f"DEBUG - API Request #{self._request_count}: {url}")
+        if response.headers.get('X-RateLimit-Remaining') == '0':
+            try:
+                return max(1.0, int(response.headers['X-RateLimit-Reset']) - time.time() + 2)
+            except (KeyError, ValueError):
+                return float(SECONDARY_RATE_LIMIT_WAIT)
+        
+        # Secondary limits ("You have exceeded a secondary rate limit") may leave the primary budget intact
+        if 'rate limit' in response.text.lower():
+            return float(SECONDARY_RATE_LIMIT_WAIT * 2 ** attempt)
+        
+        return None
+    
+    def _get_cached_etag(self, url: str) -> Optional[tuple]:
+        """Return the cached (etag, body, link) entry for a URL, if any."""
+        try:
+            with self._etag_lock, shelve.open(self._etag_cache_path) as cache:
+                return cache.get(url)
+        except Exception as e:
+            print(f"DEBUG - ETag cache read failed: {e}")
+            return None
+    
+    def _store_etag(self, url: str, response: requests.Response) -> None:
+        """Remember a 200 response's ETag and body for later conditional requests."""
+        etag = response.headers.get('ETag')
+        if not etag:
+            return
+        try:
+            with self._etag_lock, shelve.open(self._etag_cache_path) as cache:
+                cache[url] = (etag, response.content, response.headers.get('Link'))
+        except Exception as e:
+            print(f"DEBUG - ETag cache write failed: {e}")
+    
+    def _get_archived_repository(self, full_name: str, pushed_at: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Return the data collected for an archived repository on an earlier run, if still current."""
+        try:
+            with self._archive_lock, shelve.open(self._archive_cache_path) as cache:
+                entry = cache.get(full_name)
+        except Exception as e:
+            print(f"DEBUG - Archived repository cache read failed: {e}")
+            return None
+        # Re-collect periodically so a run that collected incomplete data doesn't stick forever
+        if entry and entry[0] == pushed_at and time.time() - entry[1] < ARCHIVED_REPO_CACHE_TTL:
+            return entry[2]
+        return None
+    
+    def _store_archived_repository(self, full_name: str, pushed_at: Optional[str], repo_data: Dict[str, Any]) -> None:
+        """Remember an archived repository's collected data so later runs can reuse it."""
+        try:
+            with self._archive_lock, shelve.open(self._archive_cache_path) as cache:
+                cache[full_name] = (pushed_at, time.time(), repo_data)
+        except Exception as e:
+            print(f"DEBUG - Archived repository cache write failed: {e}")
+    
+    def _make_request(self, url: str, rate_type: str = 'search', retries: int = 3,
+                      params: Optional[Dict[str, Any]] = None,
+                      headers: Optional[Dict[str, str]] = None) -> Optional[requests.Response]:
+        """Make GitHub API request with rate limiting; retries only back off on rate limit errors."""
+        with self._request_count_lock:
+            self._request_count += 1
+            request_number = self._request_count
+        
+        print(f"DEBUG - API Request #{request_number}: {url} {params or ''}")
         
         for attempt in range(retries):
             if not self._wait_for_rate_limit(rate_type):
                 print(f"DEBUG - Rate limits exhausted for {rate_type} API")
                 return None
             
+            self._throttle(rate_type)
             try:
-                response = requests.get(url, headers=self._get_headers())
+                with self._rate_semaphores.get(rate_type, self._rate_semaphores['core']):
+                    response = self._session.get(url, params=params, headers=headers)
+                self._update_rate_limits(response)
                 
                 print(f"DEBUG - Response: {response.status_code} - Content-Length: {len(response.content)} bytes")
                 
-                if response.status_code == 200:
-                    time.sleep(0.5)  # Rate limiting courtesy delay
+                # 304 Not Modified only answers conditional requests; the caller serves its cached copy
+                if response.status_code in (200, 304):
                     return response
                 
-                if response.status_code == 403 and "rate limit exceeded" in response.text.lower():
-                    print(f"DEBUG - Rate limit exceeded, waiting for reset")
-                    if not self._wait_for_rate_limit(rate_type):
+                wait_seconds = self._rate_limit_backoff(response, attempt)
+                if wait_seconds is not None:
+                    if attempt == retries - 1 or wait_seconds > MAX_RATE_LIMIT_WAIT:
+                        print(f"WARNING: Rate limited on {url} ({response.status_code}), giving up after {attempt + 1} attempts")
                         return None
+                    print(f"DEBUG - Rate limited ({response.status_code}), backing off {int(wait_seconds)} seconds")
+                    time.sleep(wait_seconds)
                     continue
                 
+                # Transient 5xx/429 errors were already retried with backoff by the session adapter
                 print(f"DEBUG - API Error: {response.status_code} - {response.text[:200]}")
-                
-                if attempt == retries - 1:
-                    return response
-                    
-                wait_time = 2 ** attempt
-                print(f"DEBUG - Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
+                return response
                 
             except Exception as e:
                 print(f"DEBUG - Request exception: {str(e)}")
-                if attempt == retries - 1:
-                    return None
-                
-                wait_time = 2 ** attempt
-                print(f"DEBUG - Retrying in {wait_time} seconds...")
-                time.sleep(wait_time)
+                return None
         
         return None
     
+    def _fetch_json(self, url: str, rate_type: str = 'core', conditional: bool = False,
+                    params: Optional[Dict[str, Any]] = None) -> Optional[Tuple[Any, Dict[str, Dict[str, str]]]]:
+        """Fetch a JSON resource and return (data, links), or None if the request failed.
+        
+        With conditional=True the request carries If-None-Match from the ETag cache and a
+        304 reply is answered from the cached body and Link header.
+        """
+        cache_key = f"{url}#{urlencode(params)}" if params else url
+        cached = self._get_cached_etag(cache_key) if conditional else None
+        headers = {'If-None-Match': cached[0]} if cached else None
+        
+        response = self._make_request(url, rate_type, params=params, headers=headers)
+        if not response:
+            return None
+        
+        if response.status_code == 304 and cached:
+            print(f"DEBUG - Not modified, serving cached body for {url}")
+            _, body, link = cached
+            links = {item.get('rel') or item.get('url'): item for item in parse_header_links(link)} if link else {}
+            return orjson.loads(body), links
+        
+        if response.status_code != 200:
+            return None
+        
+        if conditional:
+            self._store_etag(cache_key, response)
+        return orjson.loads(response.content), response.links
+    
     def _paginate_search_results(self, base_url: str, rate_type: str = 'search') -> Dict[str, Any]:
         """Paginate through all search results to get complete data."""
         all_items = []
@@ -149,14 +413,13 @@ class GitHubService:
         print(f"DEBUG - Starting pagination for: {base_url}")
         
         while True:
-            paginated_url = f"{base_url}&per_page={per_page}&page={page}"
-            response = self._make_request(paginated_url, rate_type)
+            response = self._make_request(base_url, rate_type, params={'per_page': per_page, 'page': page})
             
             if not response or response.status_code != 200:
                 print(f"DEBUG - Pagination failed at page {page}")
                 break
             
-            data = response.json()
+            data = orjson.loads(response.content)
             items = data.get('items', [])
             
             if not items:
@@ -184,7 +447,8 @@ class GitHubService:
             'total_count': max(total_count, len(all_items))
         }
     
-    def _paginate_list_results(self, base_url: str, rate_type: str = 'core') -> List[Dict[str, Any]]:
+    def _paginate_list_results(self, base_url: str, rate_type: str = 'core',
+                               conditional: bool = False) -> List[Dict[str, Any]]:
         """Paginate through all list results (non-search API)."""
         all_items = []
         page = 1
@@ -193,14 +457,15 @@ class GitHubService:
         print(f"DEBUG - Starting list pagination for: {base_url}")
         
         while True:
-            paginated_url = f"{base_url}?per_page={per_page}&page={page}"
-            response = self._make_request(paginated_url, rate_type)
+            result = self._fetch_json(
+                base_url, rate_type, conditional=conditional, params={'per_page': per_page, 'page': page}
+            )
             
-            if not response or response.status_code != 200:
+            if result is None:
                 print(f"DEBUG - List pagination failed at page {page}")
                 break
             
-            items = response.json()
+            items, _ = result
             
             if not items:
                 print(f"DEBUG - No more items at page {page}")
@@ -220,37 +485,110 @@ class GitHubService:
     def fetch_repository_data(self, owner: str, repo: str) -> Dict[str, Any]:
         """Fetch basic repository information."""
         repo_url = f"{self.api_url}/repos/{owner}/{repo}"
-        response = self._make_request(repo_url, 'core')
+        result = self._fetch_json(repo_url, 'core', conditional=True)
         
-        if response and response.status_code == 200:
-            return response.json()
+        if result is not None:
+            return result[0]
         
         return {}
     
     def fetch_contributors(self, owner: str, repo: str) -> List[Dict[str, Any]]:
         """Fetch ALL contributors for a repository."""
         contributors_url = f"{self.api_url}/repos/{owner}/{repo}/contributors"
-        return self._paginate_list_results(contributors_url, 'core')
+        return self._paginate_list_results(contributors_url, 'core', conditional=True)
     
     def fetch_repository_labels(self, owner: str, repo: str) -> List[Dict[str, Any]]:
         """Fetch all labels for a repository."""
         labels_url = f"{self.api_url}/repos/{owner}/{repo}/labels"
-        return self._paginate_list_results(labels_url, 'core')
+        return self._paginate_list_results(labels_url, 'core', conditional=True)
 
-    def fetch_organization_repositories(self) -> List[Dict[str, str]]:
+    def _make_graphql_request(self, query: str, variables: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Run a GraphQL query against the GitHub v4 API and return its data payload."""
+        with self._request_count_lock:
+            self._request_count += 1
+            request_number = self._request_count
+        
+        print(f"DEBUG - GraphQL Request #{request_number}: {variables.get('owner')}/{variables.get('name')}")
+        
+        if not self._wait_for_rate_limit('graphql'):
+            print("DEBUG - Rate limits exhausted for graphql API")
+            return None
+        
+        try:
+            with self._rate_semaphores['core']:
+                response = self._session.post(
+                    f"{self.api_url}/graphql",
+                    json={'query': query, 'variables': variables}
+                )
+            self._update_rate_limits(response)
+        except Exception as e:
+            print(f"DEBUG - GraphQL request exception: {str(e)}")
+            return None
+        
+        if response.status_code != 200:
+            print(f"DEBUG - GraphQL Error: {response.status_code} - {response.text[:200]}")
+            return None
+        
+        payload = orjson.loads(response.content)
+        if payload.get('errors'):
+            print(f"DEBUG - GraphQL Errors: {payload['errors'][:3]}")
+            return None
+        
+        return payload.get('data')
+    
+    def _get_last_page(self, links: Dict[str, Dict[str, str]]) -> int:
+        """Read the last page number from a paginated response's parsed Link header."""
+        last_url = links.get('last', {}).get('url')
+        if not last_url:
+            return 1
+        
+        page_values = parse_qs(urlparse(last_url).query).get('page', ['1'])
+        try:
+            return int(page_values[0])
+        except ValueError:
+            return 1
+    
+    def fetch_organization_repositories(self) -> List[Dict[str, Any]]:
         """Fetch all repositories for the organization."""
         try:
             org_url = f"{self.api_url}/orgs/{self.repo_owner}/repos"
-            response = self._make_request(org_url, 'core')
+            result = self._fetch_json(org_url, 'core', conditional=True, params={'per_page': 100, 'page': 1})
             
-            if response and response.status_code == 200:
-                repos_data = response.json()
-                repos = [{'name': repo['name'], 'owner': repo['owner']['login']} for repo in repos_data]
-                print(f"Found {len(repos)} repositories in {self.repo_owner}")
-                return repos
+            if result is None:
+                print(f"Failed to fetch repositories for {self.repo_owner}")
+                return []
             
-            print(f"Failed to fetch repositories for {self.repo_owner}")
-            return []
+            repos_data, links = result
+            
+            # First page tells us how many pages exist, fetch the rest concurrently
+            last_page = self._get_last_page(links)
+            if last_page > 1:
+                print(f"DEBUG - Fetching repository pages 2-{last_page} concurrently")
+                with ThreadPoolExecutor(max_workers=min(8, last_page - 1)) as executor:
+                    page_results = executor.map(
+                        lambda page: self._fetch_json(
+                            org_url, 'core', conditional=True, params={'per_page': 100, 'page': page}
+                        ),
+                        range(2, last_page + 1)
+                    )
+                    for page, page_result in enumerate(page_results, 2):
+                        if page_result is not None:
+                            repos_data.extend(page_result[0])
+                        else:
+                            print(f"WARNING: Failed to fetch repository page {page} for {self.repo_owner}")
+            
+            repos = [
+                {
+                    'name': repo['name'],
+                    'owner': repo['owner']['login'],
+                    'archived': bool(repo.get('archived')),
+                    'pushed_at': repo.get('pushed_at')
+                }
+                for repo in repos_data
+            ]
+            archived = sum(repo['archived'] for repo in repos)
+            print(f"Found {len(repos)} repositories in {self.repo_owner} ({archived} archived)")
+            return repos
             
         except Exception as e:
             print(f"Error fetching repositories: {e}")
@@ -290,20 +628,147 @@ class GitHubService:
             'total_count': len(commits_list)
         }
     
+    def fetch_repository_bundle_graphql(self, owner: str, repo: str) -> Optional[Dict[str, Any]]:
+        """Fetch repo info, merged PRs, issues and commits through one paginated GraphQL query.
+        
+        Returns the same shapes the REST fetchers produce, or None if GraphQL is unavailable.
+        A failed later page is retried; if it keeps failing, the pages already fetched are
+        discarded and the caller falls back to the REST fetchers for the whole repository.
+        Commit authors are mapped like REST does; see _graphql_commit_author.
+        """
+        variables = {
+            'owner': owner, 'name': repo,
+            'prCursor': None, 'issueCursor': None, 'commitCursor': None,
+            'withPrs': True, 'withIssues': True, 'withCommits': True
+        }
+        repo_info = {}
+        pull_requests = {'items': [], 'total_count': 0}
+        issues = {'items': [], 'total_count': 0}
+        commits = {'items': [], 'total_count': 0}
+        
+        while variables['withPrs'] or variables['withIssues'] or variables['withCommits']:
+            repository = None
+            for attempt in range(GRAPHQL_PAGE_ATTEMPTS):
+                data = self._make_graphql_request(REPOSITORY_BUNDLE_QUERY, variables)
+                repository = (data or {}).get('repository')
+                # A failed first page means GraphQL is unavailable; later pages are worth retrying
+                # before throwing away what was fetched and paying for the REST search fallback
+                if repository or not repo_info or attempt == GRAPHQL_PAGE_ATTEMPTS - 1:
+                    break
+                print(f"DEBUG - GraphQL page failed for {owner}/{repo}, retrying ({attempt + 1}/{GRAPHQL_PAGE_ATTEMPTS})")
+                time.sleep(2 ** attempt)
+            if not repository:
+                return None
+            
+            if not repo_info:
+                repo_info = {
+                    'name': repository.get('name', repo),
+                    'full_name': repository.get('nameWithOwner', f"{owner}/{repo}"),
+                    'stargazers_count': repository.get('stargazerCount', 0),
+                    'forks_count': repository.get('forkCount', 0)
+                }
+            
+            if variables['withPrs']:
+                connection = repository.get('pullRequests') or {}
+                pull_requests['total_count'] = connection.get('totalCount', 0)
+                pull_requests['items'].extend(
+                    {'number': node.get('number'), 'created_at': node.get('createdAt', ''), 'user': self._graphql_actor(node.get('author'))}
+                    for node in connection.get('nodes') or [] if node
+                )
+                variables['withPrs'], variables['prCursor'] = self._next_graphql_page(connection)
+            
+            if variables['withIssues']:
+                connection = repository.get('issues') or {}
+                issues['total_count'] = connection.get('totalCount', 0)
+                issues['items'].extend(
+                    {'number': node.get('number'), 'created_at': node.get('createdAt', ''), 'user': self._graphql_actor(node.get('author'))}
+                    for node in connection.get('nodes') or [] if node
+                )
+                variables['withIssues'], variables['issueCursor'] = self._next_graphql_page(connection)
+            
+            if variables['withCommits']:
+                target = (repository.get('defaultBranchRef') or {}).get('target') or {}
+                connection = target.get('history') or {}
+                commits['total_count'] = connection.get('totalCount', 0)
+                commits['items'].extend(
+                    {
+                        'sha': node.get('oid'),
+                        'author': self._graphql_commit_author(node.get('author')),
+                        'commit': {'author': {'date': (node.get('author') or {}).get('date', '')}}
+                    }
+                    for node in connection.get('nodes') or [] if node
+                )
+                variables['withCommits'], variables['commitCursor'] = self._next_graphql_page(connection)
+        
+        print(f"DEBUG - GraphQL bundle for {owner}/{repo}: {len(pull_requests['items'])} PRs, "
+              f"{len(issues['items'])} issues, {len(commits['items'])} commits")
+        
+        return {
+            'repo_info': repo_info,
+            'pull_requests': pull_requests,
+            'issues': issues,
+            'commits_search': commits
+        }
+    
+    def _graphql_actor(self, author: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+        """Convert a GraphQL actor to the REST user shape; Bot logins get REST's '[bot]' suffix."""
+        if not author or not author.get('login'):
+            return None
+        login = author['login']
+        if author.get('__typename') == 'Bot':
+            login = f"{login}[bot]"
+        return {'login': login}
+    
+    def _graphql_commit_author(self, author: Optional[Dict[str, Any]]) -> Optional[Dict[str, str]]:
+        """Convert a GraphQL commit author to REST's commit 'author' user.
+        
+        author.user only resolves to User accounts, so it is null for bots such as dependabot[bot]
+        that REST attributes through their noreply email; fall back to the login in that email.
+        Commits whose email matches no account stay unattributed, as they are in REST.
+        """
+        if not author:
+            return None
+        user = author.get('user')
+        if user and user.get('login'):
+            return {'login': user['login']}
+        match = NOREPLY_EMAIL_PATTERN.match(author.get('email') or '')
+        return {'login': match.group(1)} if match else None
+    
+    def _next_graphql_page(self, connection: Dict[str, Any]):
+        """Return (has_next_page, end_cursor) for a GraphQL connection."""
+        page_info = connection.get('pageInfo') or {}
+        return bool(page_info.get('hasNextPage')), page_info.get('endCursor')
+    
     def collect_complete_repository_data(self, owner: str, repo: str) -> Dict[str, Any]:
         """Collect ALL data for a single repository."""
         print(f"DEBUG - Starting complete data collection for {owner}/{repo}")
         
-        repo_data = {
-            'name': repo,
-            'owner': owner,
-            'repo_info': self.fetch_repository_data(owner, repo),
-            'contributors': self.fetch_contributors(owner, repo),
-            'pull_requests': self.search_pull_requests(owner, repo),
-            'issues': self.search_issues(owner, repo),
-            'commits_search': self.search_commits(owner, repo),
-            'labels': self.fetch_repository_labels(owner, repo)
-        }
+        # Repo info, PRs, issues and commits come from a single GraphQL query when possible;
+        # contributors and labels stay on REST. The fetches are independent, so run them concurrently.
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            bundle_future = executor.submit(self.fetch_repository_bundle_graphql, owner, repo)
+            contributors_future = executor.submit(self.fetch_contributors, owner, repo)
+            labels_future = executor.submit(self.fetch_repository_labels, owner, repo)
+            bundle = bundle_future.result()
+            
+            if bundle is None:
+                print(f"DEBUG - GraphQL bundle unavailable for {owner}/{repo}, falling back to REST")
+                rest_fetchers = {
+                    'repo_info': self.fetch_repository_data,
+                    'pull_requests': self.search_pull_requests,
+                    'issues': self.search_issues,
+                    'commits_search': self.search_commits
+                }
+                rest_futures = {key: executor.submit(fetch, owner, repo) for key, fetch in rest_fetchers.items()}
+                bundle = {key: future.result() for key, future in rest_futures.items()}
+            
+            repo_data = {
+                'name': repo,
+                'owner': owner,
+                **bundle,
+                'contributors': contributors_future.result(),
+                'labels': labels_future.result()
+            }
         
         # Log summary of collected data
         print(f"DEBUG - Data collection summary for {owner}/{repo}:")
@@ -345,13 +810,28 @@ class GitHubService:
         
         print(f"DEBUG - Processing {len(repos)} repositories")
         
-        for i, repo in enumerate(repos):
-            print(f"\n========== Processing repository {i+1}/{len(repos)}: {repo['owner']}/{repo['name']} ==========")
+        def collect_repo(index: int, repo: Dict[str, Any]) -> Dict[str, Any]:
+            full_name = f"{repo['owner']}/{repo['name']}"
+            print(f"\n========== Processing repository {index+1}/{len(repos)}: {full_name} ==========")
             
-            repo_data = self.collect_complete_repository_data(repo['owner'], repo['name'])
-            all_data['repositories'][repo['name']] = repo_data
+            # Archived repositories can't change, so reuse their last collected data instead of spending API budget
+            if repo.get('archived'):
+                cached = self._get_archived_repository(full_name, repo.get('pushed_at'))
+                if cached is not None:
+                    print(f"DEBUG - Reusing previously collected data for archived repository {full_name}")
+                    return cached
             
+            repo_data = self.collect_complete_repository_data(repo['owner'], repo['name'])
+            if repo.get('archived'):
+                self._store_archived_repository(full_name, repo.get('pushed_at'), repo_data)
             print(f"DEBUG - Completed data collection for {repo['name']}")
+            return repo_data
+        
+        # Overlap repositories; the per-bucket semaphores keep total in-flight requests bounded
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_repos) as executor:
+            results = executor.map(collect_repo, range(len(repos)), repos)
+            for repo, repo_data in zip(repos, results):
+                all_data['repositories'][repo['name']] = repo_data
         
         all_data['total_api_requests'] = self._request_count
         print(f"DEBUG - Total API requests made: {self._request_count}")
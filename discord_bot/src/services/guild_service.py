@@ -4,13 +4,20 @@ Discord Guild Manager
 Manages Discord server roles and channels based on GitHub data.
 """
 
+import asyncio
 import discord
+import logging
 from discord.ext import commands
 from typing import Dict, Any, Optional, List
 import time
 import os
 from shared.firestore import get_document, set_document, update_document, query_collection
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of members whose roles are being updated at the same time
+MEMBER_UPDATE_CONCURRENCY = 10
+
 class GuildService:
     """Manages Discord guild roles and channels based on GitHub activity."""
     
@@ -19,13 +26,18 @@ class GuildService:
         if not self._token:
             raise ValueError("DISCORD_BOT_TOKEN environment variable is required")
         self._role_service = role_service
+        
+        # Optional: restrict updates to a single guild instead of every guild the bot has joined
+        primary_guild_id = os.getenv('PRIMARY_GUILD_ID')
+        self._primary_guild_id = int(primary_guild_id) if primary_guild_id else None
     
     async def update_roles_and_channels(self, user_mappings: Dict[str, str], contributions: Dict[str, Any], metrics: Dict[str, Any]) -> bool:
         """Update Discord roles and channels in a single connection session."""
         intents = discord.Intents.default()
         intents.message_content = True
         intents.members = True
-        client = discord.Client(intents=intents)
+        # Skip chunking every member at startup; only linked members are fetched, on demand
+        client = discord.Client(intents=intents, chunk_guilds_at_startup=False)
         
         success = False
         
@@ -40,16 +52,22 @@ class GuildService:
                     print("WARNING: Bot is not connected to any Discord servers")
                     return
                 
-                for guild in client.guilds:
-                    print(f"Processing guild: {guild.name} (ID: {guild.id})")
-                    
-                    # Update roles
-                    updated_count = await self._update_roles_for_guild(guild, user_mappings, contributions)
-                    print(f"Updated {updated_count} members in {guild.name}")
-                    
-                    # Update channels
-                    await self._update_channels_for_guild(guild, metrics)
-                    print(f"Updated channels in {guild.name}")
+                guilds = self._get_target_guilds(client)
+                if not guilds:
+                    print(f"WARNING: Bot is not a member of configured guild {self._primary_guild_id}")
+                    return
+                
+                # Hall of fame is the same for every guild, so fetch it and derive medals once
+                medal_assignments = {}
+                if self._role_service:
+                    hall_of_fame_data = await asyncio.to_thread(self._role_service.get_hall_of_fame_data)
+                    medal_assignments = self._role_service.get_medal_assignments(hall_of_fame_data or {})
+                
+                # Guilds are independent of each other, so update them concurrently
+                await asyncio.gather(*(
+                    self._update_guild(guild, user_mappings, contributions, metrics, medal_assignments)
+                    for guild in guilds
+                ))
                 
                 success = True
                 print("Discord updates completed successfully")
@@ -71,15 +89,33 @@ class GuildService:
             traceback.print_exc()
             return False
     
-    async def _update_roles_for_guild(self, guild: discord.Guild, user_mappings: Dict[str, str], contributions: Dict[str, Any]) -> int:
+    async def _update_guild(self, guild: discord.Guild, user_mappings: Dict[str, str], contributions: Dict[str, Any],
+                            metrics: Dict[str, Any], medal_assignments: Dict[str, str]) -> None:
+        """Update roles and stats channels for one guild; the two touch disjoint resources and run together."""
+        print(f"Processing guild: {guild.name} (ID: {guild.id})")
+        
+        updated_count, _ = await asyncio.gather(
+            self._update_roles_for_guild(guild, user_mappings, contributions, medal_assignments),
+            self._update_channels_for_guild(guild, metrics)
+        )
+        print(f"Updated {updated_count} members in {guild.name}")
+        print(f"Updated channels in {guild.name}")
+    
+    def _get_target_guilds(self, client: discord.Client) -> List[discord.Guild]:
+        """Get the guilds to update, honoring PRIMARY_GUILD_ID when configured."""
+        if self._primary_guild_id is None:
+            return list(client.guilds)
+        
+        guild = client.get_guild(self._primary_guild_id)
+        return [guild] if guild else []
+    
+    async def _update_roles_for_guild(self, guild: discord.Guild, user_mappings: Dict[str, str], contributions: Dict[str, Any],
+                                      medal_assignments: Dict[str, str]) -> int:
         """Update roles for a single guild using role service."""
         if not self._role_service:
             print("Role service not available - skipping role updates")
             return 0
         
-        hall_of_fame_data = self._role_service.get_hall_of_fame_data()
-        medal_assignments = self._role_service.get_medal_assignments(hall_of_fame_data or {})
-        
         obsolete_roles = self._role_service.get_obsolete_role_names()
         current_roles = set(self._role_service.get_all_role_names())
         existing_roles = {role.name: role for role in guild.roles}
@@ -93,56 +129,95 @@ class GuildService:
                 except Exception as e:
                     print(f"Error deleting role {role_name}: {e}")
         
-        # Create missing current roles
-        roles = {}
-        for role_name in current_roles:
-            if role_name in existing_roles:
-                roles[role_name] = existing_roles[role_name]
+        # Create missing current roles concurrently; discord.py's rate limiter paces the requests
+        roles = {role_name: existing_roles[role_name] for role_name in current_roles if role_name in existing_roles}
+        missing_roles = [role_name for role_name in current_roles if role_name not in existing_roles]
+        
+        role_creations = []
+        for role_name in missing_roles:
+            role_color = self._role_service.get_role_color(role_name)
+            role_creations.append(guild.create_role(
+                name=role_name, 
+                color=discord.Color.from_rgb(*role_color) if role_color else discord.Color.default()
+            ))
+        
+        created_roles = await asyncio.gather(*role_creations, return_exceptions=True)
+        for role_name, result in zip(missing_roles, created_roles):
+            if isinstance(result, Exception):
+                print(f"Error creating role {role_name}: {result}")
             else:
-                try:
-                    role_color = self._role_service.get_role_color(role_name)
-                    roles[role_name] = await guild.create_role(
-                        name=role_name, 
-                        color=discord.Color.from_rgb(*role_color) if role_color else discord.Color.default()
-                    )
-                    print(f"Created role: {role_name}")
-                except Exception as e:
-                    print(f"Error creating role {role_name}: {e}")
+                roles[role_name] = result
+                print(f"Created role: {role_name}")
         
-        # Update users
-        updated_count = 0
-        for member in guild.members:
-            github_username = user_mappings.get(str(member.id))
-            if not github_username or github_username not in contributions:
-                continue
-            
+        # Every role name the bot manages on members, current or obsolete
+        managed_role_names = frozenset(obsolete_roles | current_roles)
+        
+        # Update linked members concurrently; the semaphore keeps Discord API calls bounded
+        semaphore = asyncio.Semaphore(MEMBER_UPDATE_CONCURRENCY)
+        
+        determine_roles = self._role_service.determine_roles
+        
+        async def update_member(member: discord.Member, github_username: str) -> bool:
             user_data = contributions[github_username]
-            pr_count = user_data.get("pr_count", 0)
-            issues_count = user_data.get("issues_count", 0)
-            commits_count = user_data.get("commits_count", 0)
             
             # Get correct roles for user
-            pr_role, issue_role, commit_role = self._role_service.determine_roles(pr_count, issues_count, commits_count)
-            correct_roles = {pr_role, issue_role, commit_role}
-            if github_username in medal_assignments:
-                correct_roles.add(medal_assignments[github_username])
+            correct_roles = set(determine_roles(
+                user_data.get("pr_count", 0), user_data.get("issues_count", 0), user_data.get("commits_count", 0)
+            ))
+            correct_roles.add(medal_assignments.get(github_username))
             correct_roles.discard(None)
             
-            # Remove obsolete roles and roles user outgrew
-            user_bot_roles = [role for role in member.roles if role.name in (obsolete_roles | current_roles)]
-            roles_to_remove = [role for role in user_bot_roles if role.name not in correct_roles]
+            # Diff managed roles; unchanged members cost no API call
+            current_managed = {role for role in member.roles if role.name in managed_role_names}
+            desired = {roles[role_name] for role_name in correct_roles if role_name in roles}
+            roles_to_remove = current_managed - desired
+            roles_to_add = desired - current_managed
             
-            if roles_to_remove:
-                await member.remove_roles(*roles_to_remove)
-                print(f"Removed {[r.name for r in roles_to_remove]} from {member.name}")
+            if not roles_to_remove and not roles_to_add:
+                return False
             
-            # Add missing roles
-            for role_name in correct_roles:
-                if role_name in roles and roles[role_name] not in member.roles:
-                    await member.add_roles(roles[role_name])
-                    print(f"Added {role_name} to {member.name}")
+            # Set the full role list in one request, keeping every role the bot doesn't manage
+            preserved = [role for role in member.roles if not role.is_default() and role not in current_managed]
+            async with semaphore:
+                await member.edit(roles=preserved + list(desired), reason="GitHub contribution role sync")
             
-            if roles_to_remove or any(role_name in roles and roles[role_name] not in member.roles for role_name in correct_roles):
+            if logger.isEnabledFor(logging.DEBUG):
+                if roles_to_remove:
+                    logger.debug("Removed %s from %s", [r.name for r in roles_to_remove], member.name)
+                if roles_to_add:
+                    logger.debug("Added %s to %s", [r.name for r in roles_to_add], member.name)
+            return True
+        
+        # Index linked users with contribution data by int Discord ID
+        mapped_ids = {
+            int(discord_id): github_username
+            for discord_id, github_username in user_mappings.items()
+            if discord_id.isdigit() and github_username in contributions
+        }
+        
+        # Fetch uncached linked members by ID over the gateway, at most 100 per request
+        if not guild.chunked:
+            missing_ids = [discord_id for discord_id in mapped_ids if guild.get_member(discord_id) is None]
+            for start in range(0, len(missing_ids), 100):
+                try:
+                    await guild.query_members(user_ids=missing_ids[start:start + 100], limit=100, cache=True)
+                except Exception as e:
+                    print(f"Error fetching members for {guild.name}: {e}")
+        
+        # Walk linked users rather than the whole guild; get_member is a cache lookup by ID
+        member_updates = []
+        for discord_id, github_username in mapped_ids.items():
+            member = guild.get_member(discord_id)
+            if member is None:
+                continue
+            member_updates.append(update_member(member, github_username))
+        
+        results = await asyncio.gather(*member_updates, return_exceptions=True)
+        updated_count = 0
+        for result in results:
+            if isinstance(result, Exception):
+                print(f"Error updating member roles: {result}")
+            elif result:
                 updated_count += 1
         
         return updated_count
@@ -167,34 +242,36 @@ class GuildService:
                 f"Commits: {metrics.get('commits_count', 0)}"
             ]
             
-            # Keywords for matching existing channels
-            stats_keywords = ["Stars:", "Forks:", "Contributors:", "PRs:", "Issues:", "Commits:"]
+            # Target names keyed by their "Stars"/"Forks"/... prefix; match existing channels in one pass
+            desired_channels = {name.split(":", 1)[0]: name for name in channels_to_update}
             existing_stats_channels = {}
-            
             for channel in stats_category.voice_channels:
-                for keyword in stats_keywords:
-                    if channel.name.startswith(keyword):
-                        existing_stats_channels[keyword] = channel
-                        break
+                if ":" not in channel.name:
+                    continue
+                prefix = channel.name.split(":", 1)[0]
+                if prefix in desired_channels:
+                    existing_stats_channels[prefix] = channel
             
-            # Update or create channels
-            for target_name in channels_to_update:
-                keyword = target_name.split(":")[0] + ":"
-                
+            async def apply_channel(prefix: str, target_name: str) -> None:
                 try:
-                    if keyword in existing_stats_channels:
-                        channel = existing_stats_channels[keyword]
-                        if channel.name != target_name:
-                            await channel.edit(name=target_name)
-                            print(f"Updated channel: {target_name}")
-                    else:
+                    channel = existing_stats_channels.get(prefix)
+                    if channel is None:
                         await guild.create_voice_channel(name=target_name, category=stats_category)
                         print(f"Created channel: {target_name}")
+                    elif channel.name == target_name:
+                        # Channel renames are heavily rate limited, so never spend one on a no-op
+                        logger.debug("Channel already up to date: %s", target_name)
+                    else:
+                        await channel.edit(name=target_name)
+                        print(f"Updated channel: {target_name}")
                 except discord.Forbidden:
                     print(f"Permission denied for channel: {target_name}")
                 except Exception as e:
                     print(f"Error with channel {target_name}: {e}")
             
+            # Update or create channels
+            await asyncio.gather(*(apply_channel(prefix, name) for prefix, name in desired_channels.items()))
+            
             print(f"Channels updated successfully in {guild.name}")
             
         except Exception as e:
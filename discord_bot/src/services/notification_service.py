@@ -217,7 +217,7 @@ class NotificationService:
     async def _get_webhook_url(self, notification_type: str) -> Optional[str]:
         """Get webhook URL for specified notification type."""
         try:
-            webhook_config = get_document('notification_config', 'webhooks')
+            webhook_config = await asyncio.to_thread(get_document, 'notification_config', 'webhooks')
             if not webhook_config:
                 return None
             
@@ -4,7 +4,8 @@ Role Service
 Handles role determination and medal assignment logic.
 """
 
-from typing import Dict, Any, Optional, Tuple, List
+from bisect import bisect_right
+from typing import Dict, Any, Optional, Tuple
 
 
 
@@ -39,9 +40,30 @@ class RoleConfiguration:
             "⭐ 501+ Commits": 501
         }
         
+        # Ascending threshold values with matching role names, for bisect lookups
+        self.pr_threshold_values, self.pr_role_names = self._split_thresholds(self.pr_thresholds)
+        self.issue_threshold_values, self.issue_role_names = self._split_thresholds(self.issue_thresholds)
+        self.commit_threshold_values, self.commit_role_names = self._split_thresholds(self.commit_thresholds)
+        
         # Medal roles for top 3 contributors
         self.medal_roles = ["✨ PR Champion", "💫 PR Runner-up", "🔮 PR Bronze"]
         
+        # Precomputed /getstats "next role" text: first role per type and each role's successor
+        self.first_role_map = {}
+        self.next_role_map = {}
+        for stats_type, thresholds in (("pr", self.pr_thresholds), ("issue", self.issue_thresholds), ("commit", self.commit_thresholds)):
+            role_names = list(thresholds)
+            self.first_role_map[stats_type] = f"@{role_names[0]}" if role_names else "Unknown"
+            self.next_role_map[stats_type] = {
+                role_name: f"@{role_names[i + 1]}" if i + 1 < len(role_names) else "You've reached the highest level!"
+                for i, role_name in enumerate(role_names)
+            }
+        
+        # Every managed role name, de-duplicated in definition order
+        self.all_role_names = tuple(dict.fromkeys(
+            [*self.pr_thresholds, *self.issue_thresholds, *self.commit_thresholds, *self.medal_roles]
+        ))
+        
         # Obsolete role names to clean up
         self.obsolete_roles = {
             "Beginner (1-5 PRs)", "Contributor (6-15 PRs)", "Analyst (16-30 PRs)", 
@@ -93,6 +115,12 @@ class RoleConfiguration:
             "🔮 PR Bronze": (205, 180, 150)     # Rose gold
         }
 
+    @staticmethod
+    def _split_thresholds(thresholds: Dict[str, int]) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+        """Split a threshold table into ascending values and their role names."""
+        ordered = sorted(thresholds.items(), key=lambda item: item[1])
+        return tuple(value for _, value in ordered), tuple(name for name, _ in ordered)
+
 class RoleService:
     """Service for role determination and management with clean separation of concerns."""
     
@@ -102,18 +130,17 @@ class RoleService:
     
     def determine_roles(self, pr_count: int, issues_count: int, commits_count: int) -> Tuple[Optional[str], Optional[str], Optional[str]]:
         """Determine roles based on contribution counts."""
-        pr_role = self._determine_role_for_threshold(pr_count, self.config.pr_thresholds)
-        issue_role = self._determine_role_for_threshold(issues_count, self.config.issue_thresholds)
-        commit_role = self._determine_role_for_threshold(commits_count, self.config.commit_thresholds)
+        config = self.config
+        pr_role = self._determine_role_for_threshold(pr_count, config.pr_threshold_values, config.pr_role_names)
+        issue_role = self._determine_role_for_threshold(issues_count, config.issue_threshold_values, config.issue_role_names)
+        commit_role = self._determine_role_for_threshold(commits_count, config.commit_threshold_values, config.commit_role_names)
         
         return pr_role, issue_role, commit_role
     
-    def _determine_role_for_threshold(self, count: int, thresholds: Dict[str, int]) -> Optional[str]:
-        """Determine role for a specific contribution type."""
-        for role_name, threshold in reversed(list(thresholds.items())):
-            if count >= threshold:
-                return role_name
-        return None
+    def _determine_role_for_threshold(self, count: int, values: Tuple[int, ...], names: Tuple[str, ...]) -> Optional[str]:
+        """Determine role for a specific contribution type via binary search over ascending thresholds."""
+        index = bisect_right(values, count) - 1
+        return names[index] if index >= 0 else None
     
     def get_medal_assignments(self, hall_of_fame_data: Dict[str, Any]) -> Dict[str, str]:
         """Get medal role assignments for top contributors."""
@@ -131,14 +158,9 @@ class RoleService:
         
         return medal_assignments
     
-    def get_all_role_names(self) -> List[str]:
+    def get_all_role_names(self) -> Tuple[str, ...]:
         """Get all possible role names for creation."""
-        all_roles = []
-        all_roles.extend(self.config.pr_thresholds.keys())
-        all_roles.extend(self.config.issue_thresholds.keys())
-        all_roles.extend(self.config.commit_thresholds.keys())
-        all_roles.extend(self.config.medal_roles)
-        return list(set(all_roles))  # Remove duplicates
+        return self.config.all_role_names
     
     def get_obsolete_role_names(self) -> set:
         """Get obsolete role names that should be cleaned up."""
@@ -155,29 +177,11 @@ class RoleService:
     
     def get_next_role(self, current_role: str, stats_type: str) -> str:
         """Determine the next role based on current role and stats type."""
-        if stats_type == "pr":
-            thresholds = self.config.pr_thresholds
-        elif stats_type == "issue":
-            thresholds = self.config.issue_thresholds
-        elif stats_type == "commit":
-            thresholds = self.config.commit_thresholds
-        else:
+        next_roles = self.config.next_role_map.get(stats_type)
+        if next_roles is None:
             return "Unknown"
         
         if current_role == "None" or current_role is None:
-            if thresholds:
-                first_role = list(thresholds.keys())[0]
-                return f"@{first_role}"
-            return "Unknown"
-        
-        role_list = list(thresholds.items())
-        
-        for i, (role, _) in enumerate(role_list):
-            if role == current_role:
-                if i == len(role_list) - 1:
-                    return "You've reached the highest level!"
-                
-                next_role = role_list[i + 1][0]
-                return f"@{next_role}"
+            return self.config.first_role_map[stats_type]
         
-        return "Unknown" 
\ No newline at end of file
+        return next_roles.get(current_role, "Unknown")
@@ -0,0 +1,76 @@
+"""
+Environment Loader
+
+Locates the bot's .env file once and loads it at most once per process.
+"""
+
+import os
+import threading
+from functools import lru_cache
+from typing import Dict, Optional, FrozenSet
+from dotenv import load_dotenv
+
+# Candidate directories holding the .env file, in order of preference
+_ENV_DIRS = (
+    # Running from discord_bot/ (local dev, Docker container)
+    'config',
+    # Relative to this file: discord_bot/src/utils -> discord_bot/config
+    os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), 'config'),
+)
+_ENV_FILE = '.env'
+
+# Variables the bot reads through get_env, snapshotted once after loading. The snapshot is
+# frozen: later os.environ changes to these keys are not seen. Services that also run in the
+# pipeline (GitHubService, GuildService) read their variables straight from os.environ.
+_SNAPSHOT_KEYS = (
+    'DISCORD_BOT_TOKEN', 'GITHUB_CLIENT_ID', 'GITHUB_CLIENT_SECRET',
+    'OAUTH_BASE_URL', 'SECRET_KEY', 'DEVELOPMENT'
+)
+
+_loaded = False
+_load_lock = threading.Lock()
+_ENV_SNAPSHOT: Dict[str, str] = {}
+
+def _existing_files_in(directory: str) -> FrozenSet[str]:
+    """List a directory's entries with a single scandir call (callers cache the result)."""
+    try:
+        with os.scandir(directory) as entries:
+            return frozenset(entry.name for entry in entries)
+    except (FileNotFoundError, NotADirectoryError, PermissionError):
+        return frozenset()
+
+@lru_cache(maxsize=1)
+def _resolve_env_path() -> Optional[str]:
+    """Return the absolute path of the first existing .env candidate, or None."""
+    for directory in _ENV_DIRS:
+        if _ENV_FILE in _existing_files_in(directory):
+            return os.path.abspath(os.path.join(directory, _ENV_FILE))
+    return None
+
+def load_env() -> bool:
+    """Load the .env file into os.environ once per process.
+
+    Returns True if a .env file was found and loaded. Variables that are already
+    set in the environment (e.g. from the deployment) are never overridden.
+    """
+    global _loaded
+    if _loaded:
+        return _resolve_env_path() is not None
+
+    with _load_lock:
+        if not _loaded:
+            env_path = _resolve_env_path()
+            if env_path:
+                load_dotenv(env_path)
+            _ENV_SNAPSHOT.update({key: os.environ[key] for key in _SNAPSHOT_KEYS if key in os.environ})
+            _loaded = True
+
+    return _resolve_env_path() is not None
+
+def get_env(key: str, default: Optional[str] = None) -> Optional[str]:
+    """Read an environment variable; snapshotted keys return their value as of load_env()."""
+    if not _loaded:
+        load_env()
+    if key in _SNAPSHOT_KEYS:
+        return _ENV_SNAPSHOT.get(key, default)
+    return os.getenv(key, default)
@@ -1,9 +1,18 @@
 import os
-from typing import Dict, Any, Optional, List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, Optional, List, Tuple, Callable
 import firebase_admin
 from firebase_admin import credentials, firestore
+from google.api_core.exceptions import Aborted, DeadlineExceeded, ServiceUnavailable
 
 _db = None
+_db_lock = threading.Lock()
+
+# Errors worth replaying: contention aborts and transient backend unavailability
+_TRANSIENT_ERRORS = (Aborted, DeadlineExceeded, ServiceUnavailable)
 
 def _get_credentials_path() -> str:
     """Get the path to Firebase credentials file.
@@ -50,29 +59,62 @@ def _get_credentials_path() -> str:
 def _get_firestore_client():
     """Get Firestore client, initializing if needed."""
     global _db
-    if _db is None:
-        if not firebase_admin._apps:
-            cred_path = _get_credentials_path()
-            cred = credentials.Certificate(cred_path)
-            firebase_admin.initialize_app(cred)
-        _db = firestore.client()
+    if _db is not None:
+        return _db
+    
+    # Bot commands and the OAuth thread can race on first use; only one may initialize the app
+    with _db_lock:
+        if _db is None:
+            if not firebase_admin._apps:
+                cred_path = _get_credentials_path()
+                cred = credentials.Certificate(cred_path)
+                firebase_admin.initialize_app(cred)
+            _db = firestore.client()
     return _db
 
-def get_document(collection: str, document_id: str) -> Optional[Dict[str, Any]]:
-    """Get a document from Firestore."""
+def get_document(collection: str, document_id: str, field_paths: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    """Get a document from Firestore, optionally projected to the given field paths."""
     try:
         db = _get_firestore_client()
-        doc = db.collection(collection).document(document_id).get()
+        doc = db.collection(collection).document(document_id).get(field_paths=field_paths)
         return doc.to_dict() if doc.exists else None
     except Exception as e:
         print(f"Error getting document {collection}/{document_id}: {e}")
         return None
 
+def get_documents(paths: List[Tuple[str, str]]) -> List[Optional[Dict[str, Any]]]:
+    """Get several documents from Firestore in a single batched read.
+    
+    Results are returned in the same order as the requested (collection, document_id) paths.
+    """
+    try:
+        db = _get_firestore_client()
+        refs = [db.collection(collection).document(document_id) for collection, document_id in paths]
+        docs_by_path = {doc.reference.path: doc for doc in db.get_all(refs)}
+        results = []
+        for ref in refs:
+            doc = docs_by_path.get(ref.path)
+            results.append(doc.to_dict() if doc and doc.exists else None)
+        return results
+    except Exception as e:
+        print(f"Error getting documents {paths}: {e}")
+        return [None] * len(paths)
+
+def _with_retry(call: Callable[[], Any], attempts: int = 5) -> Any:
+    """Run a Firestore call, retrying transient errors with capped exponential backoff."""
+    for attempt in range(attempts):
+        try:
+            return call()
+        except _TRANSIENT_ERRORS:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(min(0.2 * 2 ** attempt, 5))
+
 def set_document(collection: str, document_id: str, data: Dict[str, Any], merge: bool = False) -> bool:
     """Set a document in Firestore."""
     try:
         db = _get_firestore_client()
-        db.collection(collection).document(document_id).set(data, merge=merge)
+        _with_retry(lambda: db.collection(collection).document(document_id).set(data, merge=merge))
         return True
     except Exception as e:
         print(f"Error setting document {collection}/{document_id}: {e}")
@@ -82,12 +124,80 @@ def update_document(collection: str, document_id: str, data: Dict[str, Any]) ->
     """Update a document in Firestore."""
     try:
         db = _get_firestore_client()
-        db.collection(collection).document(document_id).update(data)
+        _with_retry(lambda: db.collection(collection).document(document_id).update(data))
         return True
     except Exception as e:
         print(f"Error updating document {collection}/{document_id}: {e}")
         return False
 
+def _commit_in_batches(writes: List[Tuple[Any, Dict[str, Any]]], write: Callable[[Any, Any], None], description: str,
+                       max_workers: int = 8) -> int:
+    """Apply (document_ref, data) writes in WriteBatches of up to 500, committed in parallel; returns the number written.
+    
+    A batch is all-or-nothing, so when one fails for a non-transient reason its writes are
+    retried one document at a time and only the offending documents are lost.
+    """
+    def commit(chunk: List[Tuple[Any, Dict[str, Any]]]) -> None:
+        # A failed batch is applied atomically or not at all, so it is safe to rebuild and replay
+        batch = _get_firestore_client().batch()
+        for item in chunk:
+            write(batch, item)
+        batch.commit()
+    
+    def commit_chunk(chunk: List[Tuple[Any, Dict[str, Any]]]) -> int:
+        try:
+            _with_retry(partial(commit, chunk))
+            return len(chunk)
+        except Exception as e:
+            print(f"Error {description} ({len(chunk)} documents): {e}")
+            if len(chunk) == 1:
+                return 0
+        
+        print(f"Retrying {len(chunk)} documents individually")
+        written = 0
+        for item in chunk:
+            try:
+                _with_retry(partial(commit, [item]))
+                written += 1
+            except Exception as e:
+                print(f"Error {description} {item[0].path}: {e}")
+        return written
+    
+    # Firestore caps a write batch at 500 operations; independent batches are committed in parallel
+    chunks = [writes[start:start + 500] for start in range(0, len(writes), 500)]
+    if len(chunks) <= 1:
+        return sum(commit_chunk(chunk) for chunk in chunks)
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        return sum(executor.map(commit_chunk, chunks))
+
+def batch_update(collection: str, updates: Dict[str, Dict[str, Any]], max_workers: int = 8) -> int:
+    """Update many documents in a collection using batched writes; returns the number updated."""
+    # Build each DocumentReference once so retried batches don't re-resolve paths
+    collection_ref = _get_firestore_client().collection(collection)
+    writes = [(collection_ref.document(document_id), data) for document_id, data in updates.items()]
+    
+    def write(batch, item):
+        batch.update(*item)
+    
+    return _commit_in_batches(writes, write, f"batch updating {collection}", max_workers)
+
+def batch_set(operations: List[Tuple[str, str, Dict[str, Any]]], merge: bool = False, max_workers: int = 8) -> int:
+    """Set many (collection, document_id, data) documents using batched writes; returns the number written."""
+    db = _get_firestore_client()
+    collection_refs = {}
+    writes = []
+    for collection, document_id, data in operations:
+        if collection not in collection_refs:
+            collection_refs[collection] = db.collection(collection)
+        writes.append((collection_refs[collection].document(document_id), data))
+    
+    def write(batch, item):
+        document_ref, data = item
+        batch.set(document_ref, data, merge=merge)
+    
+    return _commit_in_batches(writes, write, "batch setting documents", max_workers)
+
 def delete_document(collection: str, document_id: str) -> bool:
     """Delete a document from Firestore."""
     try:
@@ -98,8 +208,9 @@ def delete_document(collection: str, document_id: str) -> bool:
         print(f"Error deleting document {collection}/{document_id}: {e}")
         return False
 
-def query_collection(collection: str, filters: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-    """Query a collection with optional filters."""
+def query_collection(collection: str, filters: Optional[Dict[str, Any]] = None,
+                     fields: Optional[List[str]] = None) -> Dict[str, Any]:
+    """Query a collection with optional filters, optionally projected to the given fields."""
     try:
         db = _get_firestore_client()
         query = db.collection(collection)
@@ -108,8 +219,50 @@ def query_collection(collection: str, filters: Optional[Dict[str, Any]] = None)
             for field, value in filters.items():
                 query = query.where(field, '==', value)
         
+        if fields:
+            query = query.select(list(fields))
+        
         docs = query.stream()
         return {doc.id: doc.to_dict() for doc in docs}
     except Exception as e:
         print(f"Error querying collection {collection}: {e}")
-        return {} 
\ No newline at end of file
+        return {}
+
+def query_where(collection: str, field: str, op: str, value: Any,
+                fields: Optional[List[str]] = None, max_workers: int = 8) -> Optional[Dict[str, Any]]:
+    """Query a collection with a single where clause; 'in' queries are split into 30-value chunks run in parallel.
+    
+    Returns None if the query, or any chunk of it, failed, so callers can't mistake partial results for complete ones.
+    """
+    def run_query(query_value: Any) -> Optional[Dict[str, Any]]:
+        try:
+            db = _get_firestore_client()
+            query = db.collection(collection).where(field, op, query_value)
+            if fields:
+                query = query.select(list(fields))
+            return _with_retry(lambda: {doc.id: doc.to_dict() for doc in query.stream()})
+        except Exception as e:
+            print(f"Error querying collection {collection} where {field} {op}: {e}")
+            return None
+    
+    if op != 'in':
+        return run_query(value)
+    
+    # Firestore accepts at most 30 values in a single 'in' filter
+    values = list(dict.fromkeys(value))
+    chunks = [values[start:start + 30] for start in range(0, len(values), 30)]
+    if len(chunks) <= 1:
+        return run_query(chunks[0]) if chunks else {}
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        chunk_results = list(executor.map(run_query, chunks))
+    
+    failed = sum(result is None for result in chunk_results)
+    if failed:
+        print(f"Error querying collection {collection}: {failed}/{len(chunks)} chunks failed")
+        return None
+    
+    results: Dict[str, Any] = {}
+    for result in chunk_results:
+        results.update(result)
+    return results